@@ -1,19 +1,55 @@
-"""zbib — 文献情报学空白挖掘工具库"""
-
-from scripts.config import TopicConfig
-from scripts.pipeline import Pipeline
-from scripts.fetch import PubMedClient, NIHClient
-from scripts.fetch_letpub import LetPubClient
-from scripts.fetch_kd import NSFCKDClient
-from scripts.transform import merge_nsfc_sources, create_search_text, filter_by_pattern
-from scripts.analyze import (
-    CategorySet, TextClassifier, AspectClassifier, GapAnalyzer, TrendDetector,
-    NSFC_SCZ_CATEGORIES, NIH_SCZ_CATEGORIES,
-    NSFC_NEURO_CATEGORIES, NIH_NEURO_CATEGORIES,
-)
-from scripts.plot import LandscapePlot, COLORS_GREEN_PURPLE
-from scripts.performance import PerformanceAnalyzer
-from scripts.quality import QualityReporter
-from scripts.keywords import KeywordAnalyzer
-from scripts.journals import is_top_journal, tag_top_journals, build_journal_query
-from scripts.network import CollaborationNetwork, ConceptNetwork
+"""zbib — 文献情报学空白挖掘工具库
+
+公开名称按需导入 (PEP 562)：`import scripts` 或 `from scripts.xxx import ...`
+不会连带加载 pipeline、抓取客户端、绘图等重量级子模块。
+"""
+
+from importlib import import_module
+
+# 公开名称 -> 所在子模块
+_EXPORTS = {
+    'TopicConfig': 'config',
+    'Pipeline': 'pipeline',
+    'PubMedClient': 'fetch',
+    'NIHClient': 'fetch',
+    'LetPubClient': 'fetch_letpub',
+    'NSFCKDClient': 'fetch_kd',
+    'merge_nsfc_sources': 'transform',
+    'create_search_text': 'transform',
+    'filter_by_pattern': 'transform',
+    'CategorySet': 'analyze',
+    'TextClassifier': 'analyze',
+    'AspectClassifier': 'analyze',
+    'GapAnalyzer': 'analyze',
+    'TrendDetector': 'analyze',
+    'NSFC_SCZ_CATEGORIES': 'analyze',
+    'NIH_SCZ_CATEGORIES': 'analyze',
+    'NSFC_NEURO_CATEGORIES': 'analyze',
+    'NIH_NEURO_CATEGORIES': 'analyze',
+    'LandscapePlot': 'plot',
+    'COLORS_GREEN_PURPLE': 'plot',
+    'PerformanceAnalyzer': 'performance',
+    'QualityReporter': 'quality',
+    'KeywordAnalyzer': 'keywords',
+    'is_top_journal': 'journals',
+    'tag_top_journals': 'journals',
+    'build_journal_query': 'journals',
+    'CollaborationNetwork': 'network',
+    'ConceptNetwork': 'network',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module 'scripts' has no attribute {name!r}") from None
+    value = getattr(import_module(f'scripts.{module}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
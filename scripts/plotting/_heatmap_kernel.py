@@ -0,0 +1,36 @@
+"""热力图单元格标注分类
+
+为 plot_heatmap_with_marginals 计算每个单元格的标注文字颜色类别，
+以 NumPy 向量化一次算出整张矩阵，代替逐格 Python 判断。
+
+类别编码:
+    0 = 深色文字 (DARK)
+    1 = 白色文字 (WHITE, 数值超过最大值一半)
+    2 = 强调色 (ACCENT, 高亮列)
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+DARK, WHITE, ACCENT = 0, 1, 2
+
+
+def classify_cells(heatmap: np.ndarray, highlight_col: int = -1) -> tuple[np.ndarray, np.ndarray]:
+    """
+    计算热力图单元格的整数标注值和颜色类别.
+
+    Args:
+        heatmap: 热力图数据矩阵
+        highlight_col: 高亮列索引 (-1 表示不高亮)
+
+    Returns:
+        (vals, classes): 截断后的整数矩阵 (int64) 与颜色类别矩阵 (uint8)
+    """
+    heat = np.asarray(heatmap)
+    vals = heat.astype(np.int64)
+    hmax = float(heat.max()) if heat.size else 0.0
+    classes = np.where(vals > hmax * 0.5, WHITE, DARK).astype(np.uint8)
+    if 0 <= highlight_col < vals.shape[1]:
+        classes[:, highlight_col] = ACCENT
+    return vals, classes
@@ -122,11 +122,12 @@ class ApplicantPlotMixin:
     def create_applicant_figure(self, profile: 'ApplicantProfile', output: str,
                                 symptoms: dict | None = None,
                                 targets: dict | None = None,
-                                title: str = '申请人前期工作基础') -> None:
+                                title: str = '申请人前期工作基础',
+                                formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         创建独立的申请人前期基础图 (4-panel).
 
-        输出 PNG 和 PDF 两种格式。
+        默认输出 PNG 和 PDF 两种格式。
 
         Args:
             profile: ApplicantProfile 对象
@@ -134,10 +135,10 @@ class ApplicantPlotMixin:
             symptoms: 症状维度定义 (保留参数，用于未来扩展)
             targets: 靶区维度定义 (保留参数)
             title: 图表标题
+            formats: 输出格式 (默认 PNG + PDF；只需 PNG 时传 ('png',))
         """
         C = self.C
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         fig = plt.figure(figsize=(12, 8), facecolor=C['BG'])
 
@@ -197,11 +198,12 @@ class ApplicantPlotMixin:
                  color='#666', style='italic')
 
         # Save
-        self._save_applicant_figure(fig, output, C)
+        self._save_applicant_figure(fig, output, C, formats=formats)
 
     def create_applicant_extended_figure(self, profile: 'ApplicantProfile',
                                          output: str,
-                                         title: str = '申请人前期工作基础') -> None:
+                                         title: str = '申请人前期工作基础',
+                                         formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         创建扩展版申请人前期基础图 (6-panel).
 
@@ -220,10 +222,10 @@ class ApplicantPlotMixin:
             profile: ApplicantProfile 对象
             output: 输出文件路径 (不含扩展名)
             title: 图表标题
+            formats: 输出格式 (默认 PNG + PDF；只需 PNG 时传 ('png',))
         """
         C = self.C
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         # ═══════════════════════════════════════════════════════════════
         # Page 1: 基础 4-panel (8×6 英寸，符合出版标准)
@@ -273,7 +275,7 @@ class ApplicantPlotMixin:
         fig1.text(0.5, 0.02, summary, ha='center', fontsize=7, color='#666')
 
         # Save Page 1
-        self._save_applicant_figure(fig1, output, C, suffix='_extended_p1')
+        self._save_applicant_figure(fig1, output, C, suffix='_extended_p1', formats=formats)
 
         # ═══════════════════════════════════════════════════════════════
         # Page 2: 补充 2-panel (8×4 英寸)
@@ -300,11 +302,12 @@ class ApplicantPlotMixin:
                       fontweight='bold', color='#2C3E50', y=0.95)
 
         # Save Page 2
-        self._save_applicant_figure(fig2, output, C, suffix='_extended_p2')
+        self._save_applicant_figure(fig2, output, C, suffix='_extended_p2', formats=formats)
 
     def create_applicant_summary_figure(self, profile: 'ApplicantProfile',
                                         output: str,
-                                        title: str = '申报者评估总览') -> None:
+                                        title: str = '申报者评估总览',
+                                        formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         创建申报者评估总览图 (象限定位 + 六维度雷达).
 
@@ -319,10 +322,10 @@ class ApplicantPlotMixin:
             profile: ApplicantProfile 对象
             output: 输出文件路径
             title: 图表标题
+            formats: 输出格式 (默认 PNG + PDF；只需 PNG 时传 ('png',))
         """
         C = self.C
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         fig = plt.figure(figsize=(12, 5), facecolor=C['BG'])
 
@@ -353,7 +356,7 @@ class ApplicantPlotMixin:
                      color='#2C3E50', y=0.97)
 
         # Save
-        self._save_applicant_figure(fig, output, C, suffix='_summary')
+        self._save_applicant_figure(fig, output, C, suffix='_summary', formats=formats)
 
     # ═══════════════════════════════════════════════════════════════════
     # 多申请人对比
@@ -361,7 +364,8 @@ class ApplicantPlotMixin:
 
     def create_comparison_figure(self, profiles: list['ApplicantProfile'],
                                  output: str,
-                                 title: str = '申请人对比分析') -> None:
+                                 title: str = '申请人对比分析',
+                                 formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         生成多申请人对比图 (2×2 layout).
 
@@ -375,6 +379,7 @@ class ApplicantPlotMixin:
             profiles: ApplicantProfile 对象列表
             output: 输出路径 (不含扩展名)
             title: 图表标题
+            formats: 输出格式 (默认 PNG + PDF；只需 PNG 时传 ('png',))
         """
         C = self.C
         fig, axes = plt.subplots(2, 2, figsize=(16, 14))
@@ -387,10 +392,10 @@ class ApplicantPlotMixin:
 
         plt.tight_layout(rect=[0, 0, 1, 0.94])
 
-        for ext in ('png', 'pdf'):
+        for ext in formats:
             fig.savefig(f"{output}.{ext}", dpi=200, bbox_inches='tight')
         plt.close(fig)
-        print(f"[Plot] 对比图 → {output}.png/pdf")
+        print(f"[Plot] 对比图 → {output}.{'/'.join(formats)}")
 
     # ═══════════════════════════════════════════════════════════════════
     # 私有绑制方法: 基础面板
@@ -994,17 +999,17 @@ class ApplicantPlotMixin:
     # ═══════════════════════════════════════════════════════════════════
 
     def _save_applicant_figure(self, fig, output: str, C: dict,
-                               suffix: str = '') -> None:
-        """保存申请人图表为 PNG 和 PDF"""
+                               suffix: str = '',
+                               formats: tuple[str, ...] = ('png', 'pdf')) -> None:
+        """保存申请人图表 (默认 PNG 和 PDF；PNG 使用 300 dpi)"""
         out = Path(output)
         base = out.with_suffix('')
         if suffix:
             base = Path(str(base) + suffix)
 
-        fig.savefig(str(base.with_suffix('.png')), dpi=300,
-                    bbox_inches='tight', facecolor=C['BG'])
-        fig.savefig(str(base.with_suffix('.pdf')),
-                    bbox_inches='tight', facecolor=C['BG'])
-        print(f"已保存: {base.with_suffix('.png')}")
-        print(f"已保存: {base.with_suffix('.pdf')}")
+        for ext in formats:
+            path = base.with_suffix(f'.{ext}')
+            dpi = {'dpi': 300} if ext == 'png' else {}
+            fig.savefig(str(path), bbox_inches='tight', facecolor=C['BG'], **dpi)
+            print(f"已保存: {path}")
         plt.close()
@@ -32,6 +32,8 @@ from .colors import COLORS_GREEN_PURPLE, CAT_COLORS
 if TYPE_CHECKING:
     import pandas as pd
 
+CHINESE_FONTS = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
+
 
 class BasePlotMixin:
     """
@@ -47,7 +49,7 @@ class BasePlotMixin:
     公开方法:
         - plot_top_bar(): 通用 Top-N 柱状图
         - setup_chinese_fonts(): 配置中文字体
-        - save_figure(): 保存图表为 PNG 和 PDF
+        - save_figure(): 保存图表 (默认 PNG 和 PDF)
     """
 
     def __init__(self, figsize: tuple[int, int] = (28, 16), lang: str = 'zh'):
@@ -68,39 +70,47 @@ class BasePlotMixin:
 
     @staticmethod
     def setup_chinese_fonts() -> None:
-        """配置 matplotlib 中文字体支持"""
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        """配置 matplotlib 中文字体支持 (已生效时不重复写 rcParams)"""
+        rc = plt.rcParams
+        if rc['font.sans-serif'] == CHINESE_FONTS and not rc['axes.unicode_minus']:
+            return
+        rc['font.sans-serif'] = CHINESE_FONTS
+        rc['axes.unicode_minus'] = False
 
     # ═══════════════════════════════════════════════════════════════════
     # 图表保存
     # ═══════════════════════════════════════════════════════════════════
 
     def save_figure(self, fig, output: str, suffix: str = '',
-                    dpi: int = 200, close: bool = True) -> Path:
+                    dpi: int = 200, close: bool = True,
+                    formats: tuple[str, ...] = ('png', 'pdf')) -> Path | None:
         """
-        保存图表为 PNG 和 PDF 格式.
+        按 formats 依次保存图表 (默认 PNG + PDF).
 
         Args:
             fig: matplotlib Figure 对象
             output: 输出路径 (不含扩展名)
             suffix: 文件名后缀 (如 '_extended')
-            dpi: PNG 分辨率
+            dpi: PNG 分辨率 (PDF 中栅格化元素同样使用此分辨率)
             close: 是否在保存后关闭图表
+            formats: 输出格式 (只需 PNG 时传 ('png',)，跳过较慢的 PDF 矢量输出)
 
         Returns:
-            保存的 PNG 文件路径
+            第一个实际写出的文件路径 (formats 为空时返回 None)
         """
         C = self.C
         out = Path(output + suffix)
-        fig.savefig(str(out.with_suffix('.png')), dpi=dpi,
-                    bbox_inches='tight', facecolor=C['BG'])
-        fig.savefig(str(out.with_suffix('.pdf')),
-                    bbox_inches='tight', facecolor=C['BG'])
-        print(f"已保存: {out.with_suffix('.png')}")
+        first = None
+        for ext in formats:
+            path = out.with_suffix(f'.{ext}')
+            fig.savefig(str(path), dpi=dpi, bbox_inches='tight', facecolor=C['BG'])
+            if ext == 'png':
+                print(f"已保存: {path}")
+            if first is None:
+                first = path
         if close:
             plt.close(fig)
-        return out.with_suffix('.png')
+        return first
 
     def _save_fig(self, fig, output: str, suffix: str = '') -> None:
         """保存图表 (兼容旧接口)"""
@@ -440,7 +440,8 @@ class BibliometricPlotMixin:
     # 综合报告
     # ═══════════════════════════════════════════════════════════════════
 
-    def create_bibliometric_report(self, perf: dict, kw_data: dict, output: str) -> None:
+    def create_bibliometric_report(self, perf: dict, kw_data: dict, output: str,
+                                   formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         生成文献计量学综合报告 (9-panel, 3×3).
 
@@ -448,10 +449,10 @@ class BibliometricPlotMixin:
             perf: 性能分析数据 (lotka, pi_timeline, inst_direction_matrix)
             kw_data: 关键词数据 (top_kw_nsfc, top_kw_nih, word_growth, trend_topics)
             output: 输出路径 (不含扩展名)
+            formats: 输出格式 (默认 PNG + PDF；只需 PNG 时传 ('png',))
         """
         C = self.C
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         fig = plt.figure(figsize=(34, 24), facecolor=C['BG'])
         gs = gridspec.GridSpec(3, 3, figure=fig, hspace=0.30, wspace=0.28,
@@ -513,14 +514,16 @@ class BibliometricPlotMixin:
                      fontsize=28, fontweight='bold', color='#2C3E50', y=0.97)
 
         out = Path(output)
-        fig.savefig(str(out.with_suffix('.png')), dpi=200, bbox_inches='tight', facecolor=C['BG'])
-        fig.savefig(str(out.with_suffix('.pdf')), bbox_inches='tight', facecolor=C['BG'])
-        print(f"已保存: {out.with_suffix('.png')}")
-        print(f"已保存: {out.with_suffix('.pdf')}")
+        for ext in formats:
+            path = out.with_suffix(f'.{ext}')
+            dpi = {'dpi': 200} if ext == 'png' else {}
+            fig.savefig(str(path), bbox_inches='tight', facecolor=C['BG'], **dpi)
+            print(f"已保存: {path}")
         plt.close()
 
     def create_performance_report(self, perf: dict, quality: dict, trends: dict,
-                                  output: str, display_cats: list[str] | None = None) -> None:
+                                  output: str, display_cats: list[str] | None = None,
+                                  formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         生成性能分析+数据质量综合图 (6-panel).
 
@@ -530,10 +533,10 @@ class BibliometricPlotMixin:
             trends: 趋势数据 (nsfc_emerging)
             output: 输出路径 (不含扩展名)
             display_cats: 显示的类别列表
+            formats: 输出格式 (默认 PNG + PDF；只需 PNG 时传 ('png',))
         """
         C = self.C
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         fig = plt.figure(figsize=(30, 18), facecolor=C['BG'])
         gs = gridspec.GridSpec(2, 3, figure=fig, hspace=0.32, wspace=0.28,
@@ -585,8 +588,9 @@ class BibliometricPlotMixin:
                      color='#2C3E50', y=0.96)
 
         out = Path(output)
-        fig.savefig(str(out.with_suffix('.png')), dpi=200, bbox_inches='tight', facecolor=C['BG'])
-        fig.savefig(str(out.with_suffix('.pdf')), bbox_inches='tight', facecolor=C['BG'])
-        print(f"已保存: {out.with_suffix('.png')}")
-        print(f"已保存: {out.with_suffix('.pdf')}")
+        for ext in formats:
+            path = out.with_suffix(f'.{ext}')
+            dpi = {'dpi': 200} if ext == 'png' else {}
+            fig.savefig(str(path), bbox_inches='tight', facecolor=C['BG'], **dpi)
+            print(f"已保存: {path}")
         plt.close()
@@ -82,8 +82,7 @@ class KeywordPlotMixin:
         """
         import networkx as nx
         C = self.C
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         n = len(temporal)
         if n == 0:
@@ -27,9 +27,11 @@ from typing import TYPE_CHECKING
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
-from matplotlib.lines import Line2D
+from matplotlib.colors import LinearSegmentedColormap
 from matplotlib.patches import Patch
+from matplotlib.transforms import blended_transform_factory
 
+from ._heatmap_kernel import classify_cells
 from .colors import CAT_COLORS, get_cmap_gp
 
 if TYPE_CHECKING:
@@ -85,7 +87,7 @@ class LandscapePlotMixin:
             else:
                 vals = [0] * len(years_nih)
             ax.bar(years_nih, vals, bottom=bottom, color=CAT_COLORS.get(cat, '#D5D8DC'),
-                   width=0.8, edgecolor='none', alpha=0.75)
+                   width=0.8, edgecolor='none', alpha=0.75, label=cat)
             bottom += np.array(vals)
 
         ax.set_ylabel('NIH项目数/年', color='#2C3E50', fontsize=18)
@@ -95,18 +97,15 @@ class LandscapePlotMixin:
         ax2 = ax.twinx()
         years_nsfc = sorted(nsfc_yearly.index)
         vals_nsfc = [nsfc_yearly.get(y, 0) for y in years_nsfc]
-        ax2.plot(years_nsfc, vals_nsfc, 'o-', color=C['ACCENT'], linewidth=2.5, markersize=5)
+        ax2.plot(years_nsfc, vals_nsfc, 'o-', color=C['ACCENT'], linewidth=2.5, markersize=5,
+                 label='NSFC (右轴)')
         ax2.set_ylabel('NSFC项目数/年', color=C['ACCENT'], fontsize=18)
         ax2.tick_params(axis='y', labelsize=14, labelcolor=C['ACCENT'])
 
-        legend_items = [
-            Line2D([0], [0], color=C['ACCENT'], linewidth=2.5, marker='o',
-                   markersize=5, label='NSFC (右轴)'),
-        ]
-        for cat in display_cats:
-            legend_items.append(Patch(facecolor=CAT_COLORS.get(cat, '#D5D8DC'),
-                                      alpha=0.75, label=cat))
-        ax.legend(handles=legend_items, loc='upper left', fontsize=13, ncol=3,
+        # 图例句柄直接取自已绘制的 artist (NSFC 折线在前)
+        h1, l1 = ax.get_legend_handles_labels()
+        h2, l2 = ax2.get_legend_handles_labels()
+        ax.legend(h2 + h1, l2 + l1, loc='upper left', fontsize=13, ncol=3,
                   framealpha=0.9, edgecolor='#CCCCCC')
         ax.set_xlim(years_range[0] - 1, years_range[1] + 1)
         ax.spines['top'].set_visible(False)
@@ -157,8 +156,7 @@ class LandscapePlotMixin:
         ax.set_ylabel('占比 (%)', fontsize=18)
         ax.set_ylim(0, 108)
         ax.tick_params(axis='y', labelsize=14)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
+        ax.spines[['top', 'right']].set_visible(False)
 
     # ═══════════════════════════════════════════════════════════════════
     # Panel C: 热力图 + 边际图
@@ -213,8 +211,7 @@ class LandscapePlotMixin:
         ax_ct.set_xlim(-0.5, n_cols - 0.5)
         ax_ct.set_xticks([])
         ax_ct.set_ylabel('N', fontsize=int(14*s))
-        for sp in ['top', 'right', 'bottom']:
-            ax_ct.spines[sp].set_visible(False)
+        ax_ct.spines[['top', 'right', 'bottom']].set_visible(False)
         ax_ct.tick_params(axis='y', labelsize=int(12*s))
         if title:
             ax_ct.set_title(title, fontsize=int(22*s), fontweight='bold',
@@ -240,20 +237,16 @@ class LandscapePlotMixin:
         ax_ch.set_yticks(range(n_rows))
         ax_ch.set_yticklabels(row_labels, fontsize=int(16*s))
 
-        for si in range(n_rows):
-            for ti in range(n_cols):
-                val = int(heatmap[si, ti])
-                if ti == highlight_col:
-                    color = C['ACCENT']
-                elif val > heatmap.max() * 0.5:
-                    color = 'white'
-                else:
-                    color = '#2C3E50'
-                ax_ch.text(ti, si, str(val), ha='center', va='center',
-                           fontsize=int(18*s), fontweight='bold', color=color)
+        vals, classes = classify_cells(heatmap, highlight_col)
+        palette = ('#2C3E50', 'white', C['ACCENT'])
+        for (si, ti), val in np.ndenumerate(vals):
+            ax_ch.text(ti, si, str(val), ha='center', va='center',
+                       fontsize=int(18*s), fontweight='bold', color=palette[classes[si, ti]])
 
         if 0 <= highlight_col < n_cols:
-            rect = plt.Rectangle((highlight_col - 0.5, -0.5), 1, n_rows,
+            # x 为数据坐标、y 为轴比例，矩形始终覆盖整列
+            rect = plt.Rectangle((highlight_col - 0.5, 0), 1, 1,
+                                  transform=blended_transform_factory(ax_ch.transData, ax_ch.transAxes),
                                   linewidth=max(1.5, 2.5*s), edgecolor=C['ACCENT'],
                                   facecolor='none', linestyle='--')
             ax_ch.add_patch(rect)
@@ -269,8 +262,7 @@ class LandscapePlotMixin:
         ax_cr.set_yticks([])
         ax_cr.set_xlabel('N', fontsize=int(14*s))
         ax_cr.invert_yaxis()
-        for sp in ['top', 'right', 'left']:
-            ax_cr.spines[sp].set_visible(False)
+        ax_cr.spines[['top', 'right', 'left']].set_visible(False)
         ax_cr.tick_params(axis='x', labelsize=int(12*s))
 
         ax_corner = fig.add_subplot(gs_c[0, 1])
@@ -415,8 +407,7 @@ class LandscapePlotMixin:
 
         ax.set_ylabel('OFC 文献数', fontsize=fs_label)
         ax.tick_params(axis='both', labelsize=fs_tick)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
+        ax.spines[['top', 'right']].set_visible(False)
 
         total = sum(vals)
         ax.text(0.02, 0.97, f'N = {total}', transform=ax.transAxes,
@@ -492,9 +483,7 @@ class LandscapePlotMixin:
 
         ax.set_yticks([])
         ax.set_xlim(0, max_cnt * 1.15)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
+        ax.spines[['top', 'right', 'left']].set_visible(False)
         ax.tick_params(axis='x', labelsize=fs_tick)
         ax.set_xlabel('N articles', fontsize=fs_label)
 
@@ -510,7 +499,8 @@ class LandscapePlotMixin:
     # 一键出图
     # ═══════════════════════════════════════════════════════════════════
 
-    def create_landscape(self, data_dict: dict, output: str) -> None:
+    def create_landscape(self, data_dict: dict, output: str,
+                         formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         一键生成完整全景图 — 2×3 或 3×3 布局.
 
@@ -531,11 +521,11 @@ class LandscapePlotMixin:
                 - suptitle: 总标题
 
             output: 输出路径 (不含扩展名)
+            formats: 输出格式 (默认 PNG + PDF；交互调试时可传 ('png',))
         """
         C = self.C
 
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         d = data_dict
         display_cats = d['display_cats']
@@ -613,10 +603,7 @@ class LandscapePlotMixin:
             ax_f.set_facecolor('#F5F0FA')
             ax_f.set_title('F  假说图', fontsize=8, fontweight='bold',
                            loc='left', color='#2C3E50')
-            for spine in ax_f.spines.values():
-                spine.set_linestyle('--')
-                spine.set_color(C['VIOLET'])
-                spine.set_linewidth(1)
+            ax_f.spines[:].set(linestyle='--', color=C['VIOLET'], linewidth=1)
             ax_f.set_xticks([])
             ax_f.set_yticks([])
             ax_f.text(0.5, 0.5, '假说图\n(待插入)',
@@ -685,10 +672,7 @@ class LandscapePlotMixin:
             ax_f.set_facecolor('#F5F0FA')
             ax_f.set_title('F  假说图（待插入）', fontsize=22, fontweight='bold',
                            loc='left', color='#2C3E50')
-            for spine in ax_f.spines.values():
-                spine.set_linestyle('--')
-                spine.set_color(C['VIOLET'])
-                spine.set_linewidth(1.5)
+            ax_f.spines[:].set(linestyle='--', color=C['VIOLET'], linewidth=1.5)
             ax_f.set_xticks([])
             ax_f.set_yticks([])
             ax_f.text(0.5, 0.5, '假说图\nHypothesis Figure\n\n（手动插入）',
@@ -702,10 +686,13 @@ class LandscapePlotMixin:
                      color='#2C3E50', y=sup_y)
 
         out = Path(output)
-        fig.savefig(str(out.with_suffix('.png')), dpi=300, bbox_inches='tight', facecolor=C['BG'])
-        fig.savefig(str(out.with_suffix('.pdf')), bbox_inches='tight', facecolor=C['BG'])
-        print(f"已保存: {out.with_suffix('.png')}")
-        print(f"已保存: {out.with_suffix('.pdf')}")
+        png_path, pdf_path = out.with_suffix('.png'), out.with_suffix('.pdf')
+        if 'png' in formats:
+            fig.savefig(png_path, dpi=300, bbox_inches='tight', facecolor=C['BG'])
+            print(f"已保存: {png_path}")
+        if 'pdf' in formats:
+            fig.savefig(pdf_path, bbox_inches='tight', facecolor=C['BG'])
+            print(f"已保存: {pdf_path}")
         plt.close()
 
     # ═══════════════════════════════════════════════════════════════════
@@ -714,7 +701,8 @@ class LandscapePlotMixin:
 
     def create_supplementary_figure(self, data: dict, output: str,
                                     display_cats: list[str] | None = None,
-                                    highlight_target: str = '') -> None:
+                                    highlight_target: str = '',
+                                    formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         生成补充数据图 (2×2, 14×9 inches).
 
@@ -727,12 +715,11 @@ class LandscapePlotMixin:
             output: 输出路径 (不含扩展名)
             display_cats: 类别显示顺序
             highlight_target: 高亮的靶区名称
+            formats: 输出格式 (默认 PNG + PDF；交互调试时可传 ('png',))
         """
-        from matplotlib.colors import LinearSegmentedColormap
         C = self.C
 
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
 
         # 出版标准尺寸 (8×5.5 英寸)
         fig = plt.figure(figsize=(8, 5.5), facecolor=C['BG'])
@@ -758,8 +745,8 @@ class LandscapePlotMixin:
                 pivot = pivot[ordered]
 
             colors = [CAT_COLORS.get(c, '#D5D8DC') for c in pivot.columns]
-            ax_a.stackplot(pivot.index, *[pivot[c] for c in pivot.columns],
-                           labels=pivot.columns, colors=colors, alpha=0.75)
+            ax_a.stackplot(pivot.index.to_numpy(), pivot.to_numpy().T,
+                           labels=list(pivot.columns), colors=colors, alpha=0.75)
 
             if '神经调控' in pivot.columns:
                 max_year = pivot.index.max()
@@ -772,8 +759,7 @@ class LandscapePlotMixin:
             ax_a.set_xlabel('Year', fontsize=7)
             ax_a.tick_params(axis='both', labelsize=6)
             ax_a.legend(fontsize=5, ncol=2, loc='upper left', framealpha=0.9)
-            ax_a.spines['top'].set_visible(False)
-            ax_a.spines['right'].set_visible(False)
+            ax_a.spines[['top', 'right']].set_visible(False)
         ax_a.set_title('A  NIH资助趋势', fontsize=8, fontweight='bold',
                        loc='left', color='#2C3E50')
 
@@ -786,24 +772,23 @@ class LandscapePlotMixin:
             top15 = filtered.nlargest(15, 'growth')
 
             y_pos = range(len(top15))
-            max_growth = top15['growth'].max()
-            colors = [plt.cm.Reds(0.3 + 0.6 * g / max_growth) for g in top15['growth']]
+            growth = top15['growth'].to_numpy(dtype=float)
+            counts = top15['recent_count'].to_numpy()
+            colors = plt.cm.Reds(0.3 + 0.6 * growth / growth.max())
 
-            ax_b.barh(y_pos, top15['recent_count'].values, color=colors,
-                      edgecolor='white', height=0.7)
+            ax_b.barh(y_pos, counts, color=colors, edgecolor='white', height=0.7)
             ax_b.set_yticks(y_pos)
             ax_b.set_yticklabels(top15['keyword'].values, fontsize=7)
             ax_b.invert_yaxis()
 
-            for i, (cnt, gr) in enumerate(zip(top15['recent_count'], top15['growth'])):
-                label = f"{gr:.1f}×" if gr < 100 else "new"
+            growth_labels = np.where(growth < 100, np.char.mod('%.1f×', growth), 'new')
+            for i, (cnt, label) in enumerate(zip(counts, growth_labels)):
                 ax_b.text(cnt + 1, i, label, va='center', fontsize=7,
                           color=C['ACCENT'], fontweight='bold')
 
             ax_b.set_xlabel('Count (3y)', fontsize=7)
             ax_b.tick_params(axis='both', labelsize=5)
-            ax_b.spines['top'].set_visible(False)
-            ax_b.spines['right'].set_visible(False)
+            ax_b.spines[['top', 'right']].set_visible(False)
         ax_b.set_title('B  新兴关键词', fontsize=8, fontweight='bold',
                        loc='left', color='#2C3E50')
 
@@ -819,19 +804,20 @@ class LandscapePlotMixin:
             ax_c.set_xticks(range(len(matrix.columns)))
             ax_c.set_xticklabels(matrix.columns, fontsize=5, rotation=30, ha='right')
             ax_c.set_yticks(range(len(matrix.index)))
-            labels_c = [inst[:20] + '..' if len(inst) > 20 else inst for inst in matrix.index]
+            idx = matrix.index.astype(str)
+            labels_c = np.where(idx.str.len() > 20, idx.str[:20] + '..', idx).tolist()
             ax_c.set_yticklabels(labels_c, fontsize=5)
 
-            for i in range(data_c.shape[0]):
-                for j in range(data_c.shape[1]):
-                    val = int(data_c[i, j])
-                    color = 'white' if val > data_c.max() * 0.5 else '#2C3E50'
-                    ax_c.text(j, i, str(val), ha='center', va='center',
-                              fontsize=5, fontweight='bold', color=color)
+            vals_c, classes_c = classify_cells(data_c)
+            palette_c = ('#2C3E50', 'white')
+            for (i, j), val in np.ndenumerate(vals_c):
+                ax_c.text(j, i, str(val), ha='center', va='center',
+                          fontsize=5, fontweight='bold', color=palette_c[classes_c[i, j]])
 
             if highlight_target and highlight_target in matrix.columns:
                 hl_col = list(matrix.columns).index(highlight_target)
-                rect = plt.Rectangle((hl_col - 0.5, -0.5), 1, len(matrix),
+                rect = plt.Rectangle((hl_col - 0.5, 0), 1, 1,
+                                      transform=blended_transform_factory(ax_c.transData, ax_c.transAxes),
                                       linewidth=1.5, edgecolor=C['ACCENT'],
                                       facecolor='none', linestyle='--')
                 ax_c.add_patch(rect)
@@ -841,8 +827,7 @@ class LandscapePlotMixin:
                               bbox=dict(boxstyle='round,pad=0.2', facecolor='#FEF9E7',
                                         edgecolor=C['ACCENT'], linewidth=1))
 
-            for spine in ax_c.spines.values():
-                spine.set_visible(False)
+            ax_c.spines[:].set_visible(False)
         ax_c.set_title('C  机构×靶区', fontsize=8, fontweight='bold',
                        loc='left', color='#2C3E50')
 
@@ -858,12 +843,14 @@ class LandscapePlotMixin:
                 'Emerging/Declining': C['SAGE'],
             }
 
-            for _, row in thematic.iterrows():
-                color = quadrant_colors.get(row['quadrant'], '#999')
-                ax_d.scatter(row['centrality'], row['density'], s=row['size'] * 25,
-                             c=color, alpha=0.7, edgecolors='white', linewidth=0.5)
-                ax_d.annotate(row['label'], (row['centrality'], row['density']),
-                              fontsize=5, fontweight='bold', color='#2C3E50',
+            xy = thematic[['centrality', 'density']].to_numpy(dtype=float)
+            colors = thematic['quadrant'].map(quadrant_colors).fillna('#999').to_numpy()
+            ax_d.scatter(xy[:, 0], xy[:, 1], s=thematic['size'].to_numpy() * 25,
+                         c=colors, alpha=0.7, edgecolors='white', linewidth=0.5)
+            ax_d.autoscale_view()
+            ax_d.set_autoscale_on(False)
+            for label, (x, y) in zip(thematic['label'], xy):
+                ax_d.annotate(label, (x, y), fontsize=5, fontweight='bold', color='#2C3E50',
                               textcoords='offset points', xytext=(3, 3))
 
             med_c = thematic['centrality'].median()
@@ -886,8 +873,7 @@ class LandscapePlotMixin:
             ax_d.set_xlabel('Centrality', fontsize=7)
             ax_d.set_ylabel('Density', fontsize=7)
             ax_d.tick_params(labelsize=6)
-            ax_d.spines['top'].set_visible(False)
-            ax_d.spines['right'].set_visible(False)
+            ax_d.spines[['top', 'right']].set_visible(False)
         ax_d.set_title('D  主题定位', fontsize=8, fontweight='bold',
                        loc='left', color='#2C3E50')
 
@@ -895,8 +881,11 @@ class LandscapePlotMixin:
                      fontsize=9, fontweight='bold', color='#2C3E50', y=0.96)
 
         out = Path(output)
-        fig.savefig(str(out.with_suffix('.png')), dpi=300, bbox_inches='tight', facecolor=C['BG'])
-        fig.savefig(str(out.with_suffix('.pdf')), bbox_inches='tight', facecolor=C['BG'])
-        print(f"已保存: {out.with_suffix('.png')}")
-        print(f"已保存: {out.with_suffix('.pdf')}")
+        png_path, pdf_path = out.with_suffix('.png'), out.with_suffix('.pdf')
+        if 'png' in formats:
+            fig.savefig(png_path, dpi=300, bbox_inches='tight', facecolor=C['BG'])
+            print(f"已保存: {png_path}")
+        if 'pdf' in formats:
+            fig.savefig(pdf_path, bbox_inches='tight', facecolor=C['BG'])
+            print(f"已保存: {pdf_path}")
         plt.close()
@@ -14,7 +14,7 @@
 
 依赖:
     - self.C: 色板字典
-    - self._save_fig(): 来自 BasePlotMixin
+    - self.save_figure(): 来自 BasePlotMixin
     - matplotlib, networkx, gridspec
 """
 
@@ -23,12 +23,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
+import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
+from matplotlib.collections import LineCollection
 
 if TYPE_CHECKING:
     import pandas as pd
-    import networkx as nx
 
 
 class NetworkPlotMixin:
@@ -36,7 +38,7 @@ class NetworkPlotMixin:
     网络分析可视化方法集 (Mixin 类).
 
     通过多重继承混入 LandscapePlot，提供网络分析相关的绑制方法。
-    要求父类提供 self.C (色板字典) 和 self._save_fig() 方法。
+    要求父类提供 self.C (色板字典) 和 self.save_figure() 方法。
 
     公开方法:
         - plot_network(): 力导向布局网络图
@@ -51,7 +53,8 @@ class NetworkPlotMixin:
     # ═══════════════════════════════════════════════════════════════════
 
     def plot_network(self, ax, G: 'nx.Graph', title: str = '',
-                     community_map: dict | None = None, top_n: int = 60) -> None:
+                     community_map: dict | None = None, top_n: int = 60,
+                     rasterize_edges: bool = False) -> None:
         """
         力导向布局网络图.
 
@@ -61,8 +64,9 @@ class NetworkPlotMixin:
             title: 标题
             community_map: 节点→社区ID 映射，用于着色
             top_n: 只显示 degree 最高的 N 个节点
+            rasterize_edges: 边在 PDF 中栅格化输出 (节点和标签仍为矢量)。
+                top_n 范围内的边数用矢量输出更小更快，仅在边数极多时开启
         """
-        import networkx as nx
         C = self.C
 
         if len(G) == 0:
@@ -73,18 +77,27 @@ class NetworkPlotMixin:
 
         # Subgraph: top nodes by degree
         if len(G) > top_n:
-            top_nodes = sorted(G.nodes(), key=lambda n: G.degree(n), reverse=True)[:top_n]
+            full_deg = dict(G.degree())
+            top_nodes = sorted(full_deg, key=full_deg.get, reverse=True)[:top_n]
             G = G.subgraph(top_nodes).copy()
-
-        # Layout
-        pos = nx.spring_layout(G, k=1.5 / max(len(G) ** 0.5, 1), iterations=50, seed=42)
-
-        # Edge drawing
-        edge_weights = [G[u][v].get('weight', 1) for u, v in G.edges()]
-        max_w = max(edge_weights) if edge_weights else 1
-        edge_widths = [0.3 + 2.0 * w / max_w for w in edge_weights]
-        nx.draw_networkx_edges(G, pos, ax=ax, width=edge_widths,
-                               alpha=0.25, edge_color='#999999')
+        deg = dict(G.degree())
+
+        # Layout: 坐标转为 (N, 2) 数组，边/节点共用
+        pos = self._spring_layout(G)
+        nodes = list(G.nodes())
+        node_idx = {n: i for i, n in enumerate(nodes)}
+        pos_arr = np.array([pos[n] for n in nodes])
+
+        # Edge drawing: 所有边合并为单个 LineCollection
+        edges_data = list(G.edges(data='weight', default=1))
+        if edges_data:
+            edge_idx = np.array([(node_idx[u], node_idx[v]) for u, v, _ in edges_data])
+            segs = np.take(pos_arr, edge_idx, axis=0)
+            edge_weights = np.fromiter((w for _, _, w in edges_data), dtype=float,
+                                       count=len(edges_data))
+            edge_widths = 0.3 + 2.0 * edge_weights / (edge_weights.max() or 1)
+            ax.add_collection(LineCollection(segs, linewidths=edge_widths, colors='#999999',
+                                             alpha=0.25, zorder=1, rasterized=rasterize_edges))
 
         # Node colors by community
         palette = [C['ACCENT'], C['INDIGO'], C['JADE'], C['VIOLET'], C['PLUM'],
@@ -92,23 +105,21 @@ class NetworkPlotMixin:
         if community_map:
             comm_ids = sorted(set(community_map.values()))
             color_map = {cid: palette[i % len(palette)] for i, cid in enumerate(comm_ids)}
-            node_colors = [color_map.get(community_map.get(n, 0), '#999') for n in G.nodes()]
+            node_colors = [color_map.get(community_map.get(n, 0), '#999') for n in nodes]
         else:
             node_colors = [C['INDIGO']] * len(G)
 
         # Node sizes by degree
-        degrees = [G.degree(n) for n in G.nodes()]
-        max_deg = max(degrees) if degrees else 1
-        node_sizes = [80 + 400 * d / max_deg for d in degrees]
+        degrees = np.fromiter(deg.values(), dtype=np.int64, count=len(deg))
+        node_sizes = 80 + 400 * degrees / max(degrees.max(), 1)
 
-        nx.draw_networkx_nodes(G, pos, ax=ax, node_size=node_sizes,
-                               node_color=node_colors, alpha=0.85, edgecolors='white',
-                               linewidths=0.5)
+        ax.scatter(pos_arr[:, 0], pos_arr[:, 1], s=node_sizes, c=node_colors, alpha=0.85,
+                   edgecolors='white', linewidths=0.5, zorder=2)
 
         # Labels for high-degree nodes
         n_labels = min(20, len(degrees))
-        label_threshold = sorted(degrees, reverse=True)[min(n_labels - 1, len(degrees) - 1)]
-        labels = {n: n for n in G.nodes() if G.degree(n) >= label_threshold}
+        label_threshold = np.partition(degrees, -n_labels)[-n_labels]
+        labels = {n: n for n in G.nodes() if deg[n] >= label_threshold}
         nx.draw_networkx_labels(G, pos, labels=labels, ax=ax, font_size=11,
                                 font_color='#2C3E50', font_weight='bold')
 
@@ -116,6 +127,27 @@ class NetworkPlotMixin:
         if title:
             ax.set_title(title, fontsize=18, fontweight='bold', loc='left', color='#2C3E50')
 
+    def _spring_layout(self, G: 'nx.Graph') -> dict:
+        """
+        力导向布局 (按图结构缓存).
+
+        同一图在报告重复生成时直接复用已计算的布局，键为节点集合与带权边集合。
+
+        Args:
+            G: networkx Graph 对象
+
+        Returns:
+            节点→坐标 字典
+        """
+        cache = self.__dict__.setdefault('_layout_cache', {})
+        key = (frozenset(G.nodes()), frozenset(G.edges(data='weight', default=1)))
+        pos = cache.get(key)
+        if pos is None:
+            k = 1.5 / max(len(G) ** 0.5, 1)
+            pos = nx.spring_layout(G, k=k, iterations=50, seed=42)
+            cache[key] = pos
+        return pos
+
     # ═══════════════════════════════════════════════════════════════════
     # 主题地图
     # ═══════════════════════════════════════════════════════════════════
@@ -151,12 +183,15 @@ class NetworkPlotMixin:
             'Emerging/Declining': C['SAGE'],
         }
 
-        for _, row in thematic_df.iterrows():
-            color = quadrant_colors.get(row['quadrant'], '#999')
-            ax.scatter(row['centrality'], row['density'], s=row['size'] * 50,
-                       c=color, alpha=0.7, edgecolors='white', linewidth=1)
-            ax.annotate(row['label'], (row['centrality'], row['density']),
-                        fontsize=10, fontweight='bold', color='#2C3E50',
+        xy = thematic_df[['centrality', 'density']].to_numpy(dtype=float)
+        colors = thematic_df['quadrant'].map(quadrant_colors).fillna('#999').to_numpy()
+        ax.scatter(xy[:, 0], xy[:, 1], s=thematic_df['size'].to_numpy() * 50,
+                   c=colors, alpha=0.7, edgecolors='white', linewidth=1)
+        # 坐标范围由散点一次确定，后续标注/参考线不再触发 autoscale
+        ax.autoscale_view()
+        ax.set_autoscale_on(False)
+        for label, (x, y) in zip(thematic_df['label'], xy):
+            ax.annotate(label, (x, y), fontsize=10, fontweight='bold', color='#2C3E50',
                         textcoords='offset points', xytext=(5, 5))
 
         # Draw quadrant lines at median
@@ -207,15 +242,14 @@ class NetworkPlotMixin:
 
         df = centrality_df.head(15)
         y = range(len(df))
-        ax.barh(y, df['degree'].values, color=C['VIOLET'], edgecolor='white', height=0.6,
-                label='Degree')
+        bars = ax.barh(y, df['degree'].to_numpy(), color=C['VIOLET'], edgecolor='white',
+                       height=0.6, label='Degree')
         ax.set_yticks(y)
-        ax.set_yticklabels(df['name'].values, fontsize=11)
+        ax.set_yticklabels(df['name'].to_numpy(), fontsize=11)
         ax.invert_yaxis()
 
-        for i, row in enumerate(df.itertuples()):
-            ax.text(row.degree + 0.3, i, f"btw={row.betweenness:.3f}",
-                    va='center', fontsize=9, color='#888888')
+        btw_labels = [f"btw={b:.3f}" for b in df['betweenness'].to_numpy()]
+        ax.bar_label(bars, labels=btw_labels, padding=3, fontsize=9, color='#888888')
 
         ax.set_xlabel('Degree (合作人数)', fontsize=12)
         ax.spines['top'].set_visible(False)
@@ -247,9 +281,10 @@ class NetworkPlotMixin:
 
         header = ['社区', '人数', '核心成员']
         rows = []
+        deg = dict(G.degree())
         for i, (cid, members) in enumerate(list(communities.items())[:8]):
             # Sort by degree in this community
-            members_sorted = sorted(members, key=lambda n: G.degree(n), reverse=True)
+            members_sorted = sorted(members, key=lambda n: deg.get(n, 0), reverse=True)
             core = ', '.join(members_sorted[:4])
             if len(members_sorted) > 4:
                 core += f' +{len(members_sorted)-4}'
@@ -261,16 +296,14 @@ class NetworkPlotMixin:
         table.auto_set_font_size(False)
         table.set_fontsize(11)
 
-        for j in range(len(header)):
-            cell = table[0, j]
-            cell.set_facecolor(C['VIOLET'])
-            cell.set_text_props(color='white', fontweight='bold', fontsize=12)
-            cell.set_edgecolor('white')
-
-        for i in range(1, len(rows) + 1):
-            for j in range(len(header)):
-                table[i, j].set_edgecolor('#E8E8E8')
-                table[i, j].set_facecolor('#F8F9FA' if i % 2 == 0 else 'white')
+        for (i, j), cell in table.get_celld().items():
+            if i == 0:
+                cell.set_facecolor(C['VIOLET'])
+                cell.set_text_props(color='white', fontweight='bold', fontsize=12)
+                cell.set_edgecolor('white')
+            else:
+                cell.set_edgecolor('#E8E8E8')
+                cell.set_facecolor('#F8F9FA' if i % 2 == 0 else 'white')
 
         if title:
             ax.set_title(title, fontsize=18, fontweight='bold', loc='left', color='#2C3E50')
@@ -311,19 +344,15 @@ class NetworkPlotMixin:
         table.auto_set_font_size(False)
         table.set_fontsize(14)
 
-        for j in range(len(header)):
-            cell = table[0, j]
-            cell.set_facecolor(C['INDIGO'])
-            cell.set_text_props(color='white', fontweight='bold', fontsize=15)
-            cell.set_edgecolor('white')
+        for (i, j), cell in table.get_celld().items():
             cell.set_height(0.08)
-
-        for i in range(1, len(rows) + 1):
-            for j in range(len(header)):
-                cell = table[i, j]
+            if i == 0:
+                cell.set_facecolor(C['INDIGO'])
+                cell.set_text_props(color='white', fontweight='bold', fontsize=15)
+                cell.set_edgecolor('white')
+            else:
                 cell.set_edgecolor('#E8E8E8')
                 cell.set_facecolor('#F8F9FA' if i % 2 == 0 else 'white')
-                cell.set_height(0.08)
                 if j == 0:
                     cell.get_text().set_fontweight('bold')
 
@@ -334,7 +363,8 @@ class NetworkPlotMixin:
     # 网络分析报告
     # ═══════════════════════════════════════════════════════════════════
 
-    def create_network_report(self, net_data: dict, output: str) -> None:
+    def create_network_report(self, net_data: dict, output: str,
+                              formats: tuple[str, ...] = ('png', 'pdf')) -> None:
         """
         生成网络分析报告 (两页).
 
@@ -350,10 +380,12 @@ class NetworkPlotMixin:
                 - mesh_graph, mesh_partition
                 - thematic_map, thematic_map_pubmed
             output: 输出路径 (不含扩展名)
+            formats: 输出格式 (默认 PNG + PDF；大网络的 PDF 保存很慢，可传 ('png',))
         """
         C = self.C
-        plt.rcParams['font.sans-serif'] = ['Arial Unicode MS', 'PingFang SC', 'Heiti SC']
-        plt.rcParams['axes.unicode_minus'] = False
+        self.setup_chinese_fonts()
+        # 输出 PDF 时边栅格化，避免数千条矢量线段拖慢保存与阅读器渲染
+        raster = 'pdf' in formats
 
         # ═══════════════════════════════════════════
         # Page 1: 社会结构
@@ -369,7 +401,8 @@ class NetworkPlotMixin:
         collab_part = net_data.get('collab_partition', {})
         if collab_G is not None:
             self.plot_network(ax1a, collab_G, title='A  PI合作网络 (最大连通分量)',
-                              community_map=collab_part, top_n=80)
+                              community_map=collab_part, top_n=80,
+                              rasterize_edges=raster)
 
         # B: 中心性排名
         ax1b = fig1.add_subplot(gs1[0, 1])
@@ -388,7 +421,8 @@ class NetworkPlotMixin:
         ax1d = fig1.add_subplot(gs1[1, 0])
         inst_G = net_data.get('inst_graph')
         if inst_G is not None:
-            self.plot_network(ax1d, inst_G, title='D  机构合作网络', top_n=40)
+            self.plot_network(ax1d, inst_G, title='D  机构合作网络', top_n=40,
+                              rasterize_edges=raster)
 
         # E: 网络统计摘要
         ax1e = fig1.add_subplot(gs1[1, 1:])
@@ -397,7 +431,7 @@ class NetworkPlotMixin:
 
         fig1.suptitle('社会结构分析  Social Structure',
                       fontsize=28, fontweight='bold', color='#2C3E50', y=0.96)
-        self._save_fig(fig1, output, '_social')
+        self.save_figure(fig1, output, '_social', formats=formats)
 
         # ═══════════════════════════════════════════
         # Page 2: 概念结构
@@ -413,7 +447,8 @@ class NetworkPlotMixin:
         concept_part = net_data.get('concept_partition', {})
         if concept_G is not None:
             self.plot_network(ax2a, concept_G, title='A  NSFC关键词共现网络',
-                              community_map=concept_part, top_n=60)
+                              community_map=concept_part, top_n=60,
+                              rasterize_edges=raster)
 
         # B: NSFC概念聚类
         ax2b = fig2.add_subplot(gs2[0, 1:])
@@ -428,7 +463,8 @@ class NetworkPlotMixin:
         mesh_part = net_data.get('mesh_partition', {})
         if mesh_G is not None:
             self.plot_network(ax2c, mesh_G, title='C  PubMed MeSH共现网络',
-                              community_map=mesh_part, top_n=60)
+                              community_map=mesh_part, top_n=60,
+                              rasterize_edges=raster)
 
         # D: 主题地图（NSFC）
         ax2d = fig2.add_subplot(gs2[1, 1])
@@ -444,4 +480,4 @@ class NetworkPlotMixin:
 
         fig2.suptitle('概念结构分析  Conceptual Structure',
                       fontsize=28, fontweight='bold', color='#2C3E50', y=0.96)
-        self._save_fig(fig2, output, '_conceptual')
+        self.save_figure(fig2, output, '_conceptual', formats=formats)
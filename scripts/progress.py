@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import io
 import sys
 import time
 from contextlib import contextmanager
@@ -49,7 +50,15 @@ class ProgressTracker:
         'cyan': '\033[96m',
     }
 
-    def __init__(self, total: int, title: str = 'Progress', width: int = 40):
+    # 步骤渲染热路径使用的颜色串，类定义时绑定一次，避免每次重绘查字典
+    _RESET = COLORS['reset']
+    _DIM = COLORS['dim']
+    _YELLOW = COLORS['yellow']
+    _GREEN = COLORS['green']
+    _RED = COLORS['red']
+
+    def __init__(self, total: int, title: str = 'Progress', width: int = 40,
+                 refresh_hz: float = 20):
         """
         初始化进度追踪器。
 
@@ -57,6 +66,7 @@ class ProgressTracker:
             total: 总步骤数
             title: 标题
             width: 进度条宽度
+            refresh_hz: 运行中状态的最大重绘频率 (Hz)，0 表示不限制
         """
         self.total = total
         self.title = title
@@ -65,16 +75,47 @@ class ProgressTracker:
         self.steps: list[dict] = []
         self.start_time = None
         self.step_start_time = None
+        self._last_line = ''
+        self._min_interval = 1.0 / refresh_hz if refresh_hz > 0 else 0.0
+        self._last_draw = 0.0
+        self._orig_stdout = None
+        self._wrapper = None
 
     def __enter__(self) -> 'ProgressTracker':
         self.start_time = time.time()
+        # 生命周期内使用全缓冲 stdout，标题/步骤/结尾在帧边界手动 flush
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is not None:
+            sys.stdout.flush()
+            self._orig_stdout = sys.stdout
+            self._wrapper = io.TextIOWrapper(
+                io.BufferedWriter(buffer, buffer_size=8192),
+                encoding=self._orig_stdout.encoding,
+                errors=self._orig_stdout.errors,
+                write_through=False,
+            )
+            sys.stdout = self._wrapper
         self._print_header()
+        self.flush()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._print_footer()
+        self.flush()
+        if self._wrapper is not None:
+            self._wrapper.flush()
+            # 期间 stdout 被他人替换 (如 pytest 捕获、嵌套重定向) 时保留对方的流
+            if sys.stdout is self._wrapper:
+                sys.stdout = self._orig_stdout
+            # 只拆解本对象创建的包装器；detach 而非 close，避免关闭底层的真实 stdout
+            self._wrapper.detach().detach()
+            self._wrapper = self._orig_stdout = None
         return False
 
+    def flush(self):
+        """将缓冲的输出写出到终端"""
+        sys.stdout.flush()
+
     def _print_header(self):
         """打印标题"""
         c = self.COLORS
@@ -133,9 +174,23 @@ class ProgressTracker:
             self.steps[-1]['end_time'] = time.time()
             self._update_step(len(self.steps) - 1, message)
 
+    def _write(self, line: str):
+        """单次写出整行；与上次输出相同则跳过写入和 flush"""
+        if line == self._last_line:
+            return
+        self._last_line = line
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
     def _print_step(self, idx: int):
         """打印步骤（初始状态）"""
-        c = self.COLORS
+        # 节流: 仅跳过覆盖同一行的连续运行中重绘，done()/error() 的终态总是输出
+        now = time.time()
+        if self._last_line.endswith('\r') and now - self._last_draw < self._min_interval:
+            return
+        self._last_draw = now
+
+        reset, dim = self._RESET, self._DIM
         step = self.steps[idx]
         symbol = self.SYMBOLS[step['status']]
 
@@ -144,16 +199,15 @@ class ProgressTracker:
         filled = int(self.width * progress)
         bar = '█' * filled + '░' * (self.width - filled)
 
-        print(f"  {c['yellow']}{symbol}{c['reset']} {step['name']:<30} ", end='')
-        print(f"{c['dim']}[{bar}] {self.current}/{self.total}{c['reset']}", end='\r')
-        sys.stdout.flush()
+        self._write(f"  {self._YELLOW}{symbol}{reset} {step['name']:<30} "
+                    f"{dim}[{bar}] {self.current}/{self.total}{reset}\r")
 
     def _update_step(self, idx: int, message: str = ''):
         """更新步骤状态"""
-        c = self.COLORS
+        reset, dim = self._RESET, self._DIM
         step = self.steps[idx]
         symbol = self.SYMBOLS[step['status']]
-        color = c['green'] if step['status'] == 'done' else c['red']
+        color = self._GREEN if step['status'] == 'done' else self._RED
 
         elapsed = step['end_time'] - step['start_time']
 
@@ -163,12 +217,12 @@ class ProgressTracker:
         bar = '█' * filled + '░' * (self.width - filled)
 
         # 清除当前行并打印完成状态
-        print(f"\r  {color}{symbol}{c['reset']} {step['name']:<30} ", end='')
-        print(f"[{bar}] {self.current}/{self.total} ", end='')
-        print(f"{c['dim']}({elapsed:.1f}s){c['reset']}")
-
+        line = (f"\r  {color}{symbol}{reset} {step['name']:<30} "
+                f"[{bar}] {self.current}/{self.total} "
+                f"{dim}({elapsed:.1f}s){reset}\n")
         if message:
-            print(f"    {c['dim']}→ {message}{c['reset']}")
+            line += f"    {dim}→ {message}{reset}\n"
+        self._write(line)
 
 
 @contextmanager
@@ -3,6 +3,12 @@
 import pandas as pd
 
 
+def _filled_counts(df: pd.DataFrame) -> pd.Series:
+    """各列非空且去空白后非空串 (且不为 'nan') 的行数，整表一次向量化计算"""
+    stripped = df.astype(str).apply(lambda s: s.str.strip())
+    return ((stripped != '') & (stripped != 'nan') & df.notna()).sum()
+
+
 class QualityReporter:
     """数据完整性评估
 
@@ -33,13 +39,10 @@ class QualityReporter:
         rows = []
         for name, df in dfs.items():
             key_fields = self.KEY_FIELDS.get(name, list(df.columns))
-            for col in key_fields:
-                if col not in df.columns:
-                    continue
-                non_null = df[col].dropna().astype(str).str.strip()
-                non_empty = (non_null.str.len() > 0) & (non_null != 'nan')
-                rate = round(non_empty.sum() / max(len(df), 1), 3)
-                rows.append({'source': name, 'field': col, 'rate': rate})
+            cols = [c for c in key_fields if c in df.columns]
+            n = max(len(df), 1)
+            for col, filled in _filled_counts(df[cols]).items():
+                rows.append({'source': name, 'field': col, 'rate': round(filled / n, 3)})
 
         return pd.DataFrame(rows)
 
@@ -60,12 +63,16 @@ class QualityReporter:
         if key_columns is None:
             key_columns = [c for c in base_df.columns if c in enriched_df.columns]
 
+        def _rate(df, c):
+            s = df[c]
+            if s.dtype.kind in 'biuf':
+                # 数值/布尔列: 非空即有值，无需转字符串
+                return s.notna().sum() / max(len(df), 1)
+            s = s.dropna().astype(str).str.strip()
+            return (s.str.len() > 0).sum() / max(len(df), 1)
+
         result = {}
         for col in key_columns:
-            def _rate(df, c):
-                s = df[c].dropna().astype(str).str.strip()
-                return (s.str.len() > 0).sum() / max(len(df), 1)
-
             before = _rate(base_df, col)
             after = _rate(enriched_df, col)
             result[col] = {
@@ -84,9 +91,7 @@ class QualityReporter:
             lines.append(f"{name}: {n:,} 条记录")
 
             # Key fields coverage
-            for col in df.columns:
-                s = df[col].dropna().astype(str).str.strip()
-                filled = ((s.str.len() > 0) & (s != 'nan')).sum()
+            for col, filled in _filled_counts(df).items():
                 pct = filled * 100 / max(n, 1)
                 if pct < 100:
                     lines.append(f"  {col}: {filled:,}/{n:,} ({pct:.0f}%)")
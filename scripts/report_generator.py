@@ -15,24 +15,56 @@
 from __future__ import annotations
 
 import base64
+import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_OL_RE = re.compile(r'\d+\. (.+)$')
+
+
+# 读取结果按 (路径, 修改时间[, 大小]) 缓存: 同一会话内重复生成报告时，
+# 未改动的输入直接复用，文件更新后 mtime 变化自动失效
+
+@lru_cache(maxsize=64)
+def _read_file_cached(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding='utf-8')
+
+
+@lru_cache(maxsize=16)
+def _read_csv_cached(path: str, mtime_ns: int) -> pd.DataFrame:
+    return pd.read_csv(path, index_col=0)
+
+
+@lru_cache(maxsize=16)
+def _image_to_base64_cached(path: str, mtime_ns: int, size: int) -> str:
+    # 按 48KB (3 的倍数) 分块编码，块间无填充，拼接结果与整体编码一致
+    chunks = []
+    with open(path, 'rb') as f:
+        while chunk := f.read(48 * 1024):
+            chunks.append(base64.b64encode(chunk).decode('ascii'))
+    data = ''.join(chunks)
+    suffix = Path(path).suffix.lower()
+    mime = 'image/png' if suffix == '.png' else 'image/jpeg'
+    return f'data:{mime};base64,{data}'
+
 
 def _read_file(path: Path) -> str:
     """安全读取文件"""
     if path.exists():
-        return path.read_text(encoding='utf-8')
+        return _read_file_cached(str(path), path.stat().st_mtime_ns)
     return ''
 
 
 def _read_csv(path: Path) -> pd.DataFrame | None:
-    """安全读取 CSV"""
+    """安全读取 CSV (返回缓存对象，调用方不应原地修改)"""
     if path.exists():
-        return pd.read_csv(path, index_col=0)
+        return _read_csv_cached(str(path), path.stat().st_mtime_ns)
     return None
 
 
@@ -40,35 +72,38 @@ def _image_to_base64(path: Path) -> str:
     """图片转 base64"""
     if not path.exists():
         return ''
-    with open(path, 'rb') as f:
-        data = base64.b64encode(f.read()).decode('utf-8')
-    suffix = path.suffix.lower()
-    mime = 'image/png' if suffix == '.png' else 'image/jpeg'
-    return f'data:{mime};base64,{data}'
+    st = path.stat()
+    return _image_to_base64_cached(str(path), st.st_mtime_ns, st.st_size)
 
 
 def _markdown_to_html(md: str) -> str:
-    """简单的 Markdown 转 HTML"""
-    # 标题
-    md = re.sub(r'^### (.+)$', r'<h3>\1</h3>', md, flags=re.MULTILINE)
-    md = re.sub(r'^## (.+)$', r'<h2>\1</h2>', md, flags=re.MULTILINE)
-    md = re.sub(r'^# (.+)$', r'<h1>\1</h1>', md, flags=re.MULTILINE)
-
-    # 粗体
-    md = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', md)
-
-    # 引用块
-    md = re.sub(r'^> (.+)$', r'<blockquote>\1</blockquote>', md, flags=re.MULTILINE)
-
-    # 列表
-    md = re.sub(r'^- (.+)$', r'<li>\1</li>', md, flags=re.MULTILINE)
-    md = re.sub(r'^(\d+)\. (.+)$', r'<li>\2</li>', md, flags=re.MULTILINE)
-
-    # 表格 (简化处理)
-    lines = md.split('\n')
+    """简单的 Markdown 转 HTML (逐行单遍扫描)"""
     in_table = False
     result = []
-    for line in lines:
+    for line in md.split('\n'):
+        # 标题
+        if line.startswith('### ') and len(line) > 4:
+            line = f'<h3>{line[4:]}</h3>'
+        elif line.startswith('## ') and len(line) > 3:
+            line = f'<h2>{line[3:]}</h2>'
+        elif line.startswith('# ') and len(line) > 2:
+            line = f'<h1>{line[2:]}</h1>'
+
+        # 粗体
+        if '**' in line:
+            line = _BOLD_RE.sub(r'<strong>\1</strong>', line)
+
+        # 引用块 / 列表
+        if line.startswith('> ') and len(line) > 2:
+            line = f'<blockquote>{line[2:]}</blockquote>'
+        elif line.startswith('- ') and len(line) > 2:
+            line = f'<li>{line[2:]}</li>'
+        elif line[:1].isdigit():
+            m = _OL_RE.match(line)
+            if m:
+                line = f'<li>{m.group(1)}</li>'
+
+        # 表格 (简化处理)
         if '|' in line and not line.strip().startswith('|--'):
             if not in_table:
                 result.append('<table class="data-table">')
@@ -85,12 +120,21 @@ def _markdown_to_html(md: str) -> str:
     if in_table:
         result.append('</table>')
 
-    # 段落
-    html = '\n'.join(result)
-    html = re.sub(r'\n\n+', '</p><p>', html)
-    html = f'<p>{html}</p>'
-
-    return html
+    # 段落: 行间以换行连接，连续空行 (≥2 个换行) 折叠为段落分隔
+    parts = ['<p>']
+    gap = 0
+    for i, line in enumerate(result):
+        if i:
+            gap += 1
+        if line:
+            if gap:
+                parts.append('</p><p>' if gap > 1 else '\n')
+            parts.append(line)
+            gap = 0
+    if gap:
+        parts.append('</p><p>' if gap > 1 else '\n')
+    parts.append('</p>')
+    return ''.join(parts)
 
 
 def _build_heatmap_html(df: pd.DataFrame | None) -> str:
@@ -98,194 +142,123 @@ def _build_heatmap_html(df: pd.DataFrame | None) -> str:
     if df is None:
         return ''
 
-    html = '<table class="heatmap">'
-    html += '<tr><th></th>' + ''.join(f'<th>{c}</th>' for c in df.columns) + '</tr>'
-    for idx, row in df.iterrows():
-        html += f'<tr><th>{idx}</th>'
-        for val in row:
-            intensity = min(val / 100, 1) if val > 0 else 0
-            color = f'rgba(76, 175, 80, {intensity})' if val > 0 else '#2a2a3e'
-            html += f'<td style="background:{color}">{int(val)}</td>'
-        html += '</tr>'
-    html += '</table>'
-    return html
-
-
-def generate_full_report(
-    project_dir: str | Path,
-    output_name: str = 'full_report.html',
-) -> Path:
-    """
-    生成综合 HTML 报告。
-
-    Args:
-        project_dir: 项目目录路径
-        output_name: 输出文件名
-
-    Returns:
-        生成的报告路径
-    """
-    project_dir = Path(project_dir)
-    results_dir = project_dir / 'results'
-    figs_dir = project_dir / 'figs'
-
-    # 收集数据
-    heatmap_df = _read_csv(results_dir / 'heatmap.csv')
-    nsfc_report = _read_file(results_dir / 'NSFC标书支撑材料.md')
-    applicant_summary = _read_file(results_dir / 'applicant_summary.txt')
-    template_md = _read_file(results_dir / '标书段落模板.md')
-
-    # 图片
-    landscape_img = ''
-    for f in figs_dir.glob('*landscape*.png'):
-        landscape_img = _image_to_base64(f)
-        break
-
-    applicant_img = ''
-    for f in figs_dir.glob('*applicant_summary*.png'):
-        applicant_img = _image_to_base64(f)
-        break
-
-    # 知识图谱 JSON
-    kg_json = '{"nodes":[],"edges":[]}'
-    kg_path = figs_dir / 'knowledge_graph.json'
-    if kg_path.exists():
-        kg_json = kg_path.read_text(encoding='utf-8')
-
-    # 项目名称和时间
-    project_name = project_dir.name
-    gen_time = datetime.now().strftime('%Y-%m-%d %H:%M')
-
-    # 构建各部分 HTML
-    heatmap_html = _build_heatmap_html(heatmap_df)
-
-    # 全景图部分
-    landscape_section = ''
-    if landscape_img:
-        landscape_section = f'''
-        <section class="section">
-            <h2>研究全景图</h2>
-            <img src="{landscape_img}" alt="研究全景图" />
-        </section>'''
-
-    # 申请人部分
-    applicant_section = ''
-    if applicant_img or applicant_summary:
-        img_tag = f'<img src="{applicant_img}" alt="申请人评估" style="max-width: 800px;" />' if applicant_img else ''
-        pre_tag = f'<pre style="background:#0a0a15;padding:20px;border-radius:8px;overflow-x:auto;margin-top:20px;font-size:12px;">{applicant_summary}</pre>' if applicant_summary else ''
-        applicant_section = f'''
-        <section class="section">
-            <h2>申请人评估</h2>
-            {img_tag}
-            {pre_tag}
-        </section>'''
-
-    # NSFC 和模板内容
-    nsfc_html = _markdown_to_html(nsfc_report) if nsfc_report else '<p>暂无数据</p>'
-    template_html = _markdown_to_html(template_md) if template_md else '<p>暂无数据</p>'
-
-    # 组装完整 HTML
-    html = f'''<!DOCTYPE html>
+    vals = df.to_numpy()
+    intensity = np.clip(vals / 100, 0, 1).tolist()
+    parts = ['<table class="heatmap"><tr><th></th>']
+    parts += [f'<th>{c}</th>' for c in df.columns]
+    parts.append('</tr>')
+    for idx, row, row_int in zip(df.index, vals.tolist(), intensity):
+        parts.append(f'<tr><th>{idx}</th>')
+        for val, a in zip(row, row_int):
+            color = f'rgba(76, 175, 80, {a})' if val > 0 else '#2a2a3e'
+            parts.append(f'<td style="background:{color}">{int(val)}</td>')
+        parts.append('</tr>')
+    parts.append('</table>')
+    return ''.join(parts)
+
+
+# 报告页面模板 (${name} 占位符，CSS/JS 中的花括号无需转义)
+_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="zh">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{project_name} - 研究分析报告</title>
+    <title>${project_name} - 研究分析报告</title>
     <script src="https://d3js.org/d3.v7.min.js"></script>
     <style>
-        :root {{
+        :root {
             --bg: #0f0f1a;
             --card-bg: #1a1a2e;
             --text: #e0e0e0;
             --text-dim: #888;
             --accent: #4CAF50;
             --accent2: #2196F3;
-        }}
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
+        }
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: var(--bg);
             color: var(--text);
             line-height: 1.6;
-        }}
-        .container {{ max-width: 1200px; margin: 0 auto; padding: 40px 20px; }}
-        header {{
+        }
+        .container { max-width: 1200px; margin: 0 auto; padding: 40px 20px; }
+        header {
             text-align: center;
             padding: 60px 20px;
             background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
             border-bottom: 1px solid #333;
-        }}
-        header h1 {{ font-size: 2.5em; margin-bottom: 10px; color: #fff; }}
-        header p {{ color: var(--text-dim); }}
-        .section {{
+        }
+        header h1 { font-size: 2.5em; margin-bottom: 10px; color: #fff; }
+        header p { color: var(--text-dim); }
+        .section {
             background: var(--card-bg);
             border-radius: 12px;
             padding: 30px;
             margin: 30px 0;
             box-shadow: 0 4px 20px rgba(0,0,0,0.3);
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             color: var(--accent);
             border-bottom: 2px solid var(--accent);
             padding-bottom: 10px;
             margin-bottom: 20px;
-        }}
-        .section h3 {{ color: var(--accent2); margin: 20px 0 10px; }}
-        .grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }}
-        .card {{
+        }
+        .section h3 { color: var(--accent2); margin: 20px 0 10px; }
+        .grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; }
+        .card {
             background: rgba(255,255,255,0.05);
             border-radius: 8px;
             padding: 20px;
-        }}
-        .card h4 {{ color: var(--accent); margin-bottom: 10px; }}
-        .heatmap {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-        .heatmap th, .heatmap td {{
+        }
+        .card h4 { color: var(--accent); margin-bottom: 10px; }
+        .heatmap { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        .heatmap th, .heatmap td {
             padding: 8px 12px;
             text-align: center;
             border: 1px solid #333;
-        }}
-        .heatmap th {{ background: #252540; color: var(--accent); }}
-        .data-table {{ width: 100%; border-collapse: collapse; margin: 15px 0; }}
-        .data-table th, .data-table td {{
+        }
+        .heatmap th { background: #252540; color: var(--accent); }
+        .data-table { width: 100%; border-collapse: collapse; margin: 15px 0; }
+        .data-table th, .data-table td {
             padding: 10px;
             text-align: left;
             border-bottom: 1px solid #333;
-        }}
-        .data-table th {{ color: var(--accent); }}
-        blockquote {{
+        }
+        .data-table th { color: var(--accent); }
+        blockquote {
             border-left: 3px solid var(--accent);
             padding-left: 15px;
             margin: 15px 0;
             color: var(--text-dim);
             font-style: italic;
-        }}
-        img {{ max-width: 100%; border-radius: 8px; margin: 20px 0; }}
-        #kg-mini {{ height: 400px; background: #0a0a15; border-radius: 8px; overflow: hidden; }}
-        .tabs {{ display: flex; gap: 10px; margin-bottom: 20px; }}
-        .tab {{
+        }
+        img { max-width: 100%; border-radius: 8px; margin: 20px 0; }
+        #kg-mini { height: 400px; background: #0a0a15; border-radius: 8px; overflow: hidden; }
+        .tabs { display: flex; gap: 10px; margin-bottom: 20px; }
+        .tab {
             padding: 10px 20px;
             background: rgba(255,255,255,0.1);
             border: none;
             border-radius: 6px;
             color: var(--text);
             cursor: pointer;
-        }}
-        .tab.active {{ background: var(--accent); color: #000; }}
-        .tab-content {{ display: none; }}
-        .tab-content.active {{ display: block; }}
-        footer {{
+        }
+        .tab.active { background: var(--accent); color: #000; }
+        .tab-content { display: none; }
+        .tab-content.active { display: block; }
+        footer {
             text-align: center;
             padding: 40px;
             color: var(--text-dim);
             font-size: 0.9em;
-        }}
-        footer a {{ color: var(--accent); text-decoration: none; }}
+        }
+        footer a { color: var(--accent); text-decoration: none; }
     </style>
 </head>
 <body>
     <header>
-        <h1>{project_name}</h1>
-        <p>研究空白分析报告 | 生成时间: {gen_time}</p>
+        <h1>${project_name}</h1>
+        <p>研究空白分析报告 | 生成时间: ${gen_time}</p>
     </header>
 
     <div class="container">
@@ -294,13 +267,13 @@ def generate_full_report(
             <div class="grid">
                 <div class="card">
                     <h4>研究空白矩阵</h4>
-                    {heatmap_html if heatmap_html else '<p>暂无数据</p>'}
+                    ${heatmap_html}
                 </div>
             </div>
         </section>
 
-        {landscape_section}
-        {applicant_section}
+        ${landscape_section}
+        ${applicant_section}
 
         <section class="section">
             <h2>知识图谱</h2>
@@ -315,10 +288,10 @@ def generate_full_report(
                 <button class="tab" onclick="showTab('template')">段落模板</button>
             </div>
             <div id="nsfc" class="tab-content active">
-                {nsfc_html}
+                ${nsfc_html}
             </div>
             <div id="template" class="tab-content">
-                {template_html}
+                ${template_html}
             </div>
         </section>
     </div>
@@ -327,16 +300,17 @@ def generate_full_report(
         <p>由 zbib 3.0 自动生成 | 文献情报学空白挖掘工具</p>
     </footer>
 
+    <script id="kg-data" type="application/json">${kg_json}</script>
     <script>
-    function showTab(id) {{
+    function showTab(id) {
         document.querySelectorAll('.tab-content').forEach(el => el.classList.remove('active'));
         document.querySelectorAll('.tab').forEach(el => el.classList.remove('active'));
         document.getElementById(id).classList.add('active');
         event.target.classList.add('active');
-    }}
+    }
 
-    const kgData = {kg_json};
-    if (kgData.nodes && kgData.nodes.length > 0) {{
+    const kgData = JSON.parse(document.getElementById('kg-data').textContent);
+    if (kgData.nodes && kgData.nodes.length > 0) {
         const width = document.getElementById('kg-mini').clientWidth;
         const height = 400;
         const svg = d3.select('#kg-mini').append('svg').attr('width', width).attr('height', height);
@@ -361,18 +335,117 @@ def generate_full_report(
 
         node.append('title').text(d => d.label);
 
-        simulation.on('tick', () => {{
+        simulation.on('tick', () => {
             link.attr('x1', d => d.source.x).attr('y1', d => d.source.y)
                 .attr('x2', d => d.target.x).attr('y2', d => d.target.y);
             node.attr('cx', d => d.x).attr('cy', d => d.y);
-        }});
-    }}
+        });
+    }
     </script>
 </body>
 </html>'''
 
+# 模板按占位符切分: 偶数位为预先编码的静态片段，奇数位为占位符名
+_HTML_PARTS = [part.encode('utf-8') if i % 2 == 0 else part
+               for i, part in enumerate(re.split(r'\$\{(\w+)\}', _HTML_TEMPLATE))]
+
+
+def generate_full_report(
+    project_dir: str | Path,
+    output_name: str = 'full_report.html',
+) -> Path:
+    """
+    生成综合 HTML 报告。
+
+    Args:
+        project_dir: 项目目录路径
+        output_name: 输出文件名
+
+    Returns:
+        生成的报告路径
+    """
+    project_dir = Path(project_dir)
+    results_dir = project_dir / 'results'
+    figs_dir = project_dir / 'figs'
+
+    # 收集数据
+    heatmap_df = _read_csv(results_dir / 'heatmap.csv')
+    nsfc_report = _read_file(results_dir / 'NSFC标书支撑材料.md')
+    applicant_summary = _read_file(results_dir / 'applicant_summary.txt')
+    template_md = _read_file(results_dir / '标书段落模板.md')
+
+    # 图片 (单次扫描 figs/，两类图都找到后提前结束)
+    landscape_img = applicant_img = ''
+    if figs_dir.is_dir():
+        with os.scandir(figs_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith('.png') or not entry.is_file():
+                    continue
+                if not landscape_img and 'landscape' in name:
+                    landscape_img = _image_to_base64(Path(entry.path))
+                if not applicant_img and 'applicant_summary' in name:
+                    applicant_img = _image_to_base64(Path(entry.path))
+                if landscape_img and applicant_img:
+                    break
+
+    # 知识图谱 JSON
+    kg_json = '{"nodes":[],"edges":[]}'
+    kg_path = figs_dir / 'knowledge_graph.json'
+    if kg_path.exists():
+        kg_json = _read_file(kg_path)
+    # 以数据块嵌入，浏览器走 JSON.parse 快速路径；转义 '<' 防止 '</script>' 提前闭合
+    kg_json = kg_json.replace('<', '\\u003c')
+
+    # 项目名称和时间
+    project_name = project_dir.name
+    gen_time = datetime.now().strftime('%Y-%m-%d %H:%M')
+
+    # 构建各部分 HTML
+    heatmap_html = _build_heatmap_html(heatmap_df)
+
+    # 全景图部分
+    landscape_section = ''
+    if landscape_img:
+        landscape_section = f'''
+        <section class="section">
+            <h2>研究全景图</h2>
+            <img src="{landscape_img}" alt="研究全景图" />
+        </section>'''
+
+    # 申请人部分
+    applicant_section = ''
+    if applicant_img or applicant_summary:
+        img_tag = f'<img src="{applicant_img}" alt="申请人评估" style="max-width: 800px;" />' if applicant_img else ''
+        pre_tag = f'<pre style="background:#0a0a15;padding:20px;border-radius:8px;overflow-x:auto;margin-top:20px;font-size:12px;">{applicant_summary}</pre>' if applicant_summary else ''
+        applicant_section = f'''
+        <section class="section">
+            <h2>申请人评估</h2>
+            {img_tag}
+            {pre_tag}
+        </section>'''
+
+    # NSFC 和模板内容
+    nsfc_html = _markdown_to_html(nsfc_report) if nsfc_report else '<p>暂无数据</p>'
+    template_html = _markdown_to_html(template_md) if template_md else '<p>暂无数据</p>'
+
+    # 组装完整 HTML (逐片段编码为 bytes 后一次写出，不拼接整页 str)
+    values = dict(
+        project_name=project_name,
+        gen_time=gen_time,
+        heatmap_html=heatmap_html or '<p>暂无数据</p>',
+        landscape_section=landscape_section,
+        applicant_section=applicant_section,
+        nsfc_html=nsfc_html,
+        template_html=template_html,
+        kg_json=kg_json,
+    )
+
+    chunks = [part if i % 2 == 0 else values[part].encode('utf-8')
+              for i, part in enumerate(_HTML_PARTS)]
+
     output_path = project_dir / output_name
-    output_path.write_text(html, encoding='utf-8')
+    output_path.write_bytes(b''.join(chunks))
     print(f"[Report] 综合报告 -> {output_path}")
 
     return output_path
@@ -1,8 +1,10 @@
 """数据转换: 合并、拼接、过滤"""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 
@@ -11,13 +13,14 @@ def merge_nsfc_sources(letpub_path: str, kd_path: str, output_path: str):
     letpub_path, kd_path, output_path = Path(letpub_path), Path(kd_path), Path(output_path)
 
     print(f"[1] 读取 LetPub: {letpub_path}")
-    df_letpub = pd.read_excel(letpub_path)
-    df_letpub["项目编号"] = df_letpub["项目编号"].astype(str).str.strip()
+    df_letpub = pd.read_excel(letpub_path, engine="openpyxl", dtype={"项目编号": str})
+    # 两侧编号均按字符串读取，缺失值统一记为 "nan" (与旧版 astype(str) 结果一致)
+    df_letpub["项目编号"] = df_letpub["项目编号"].fillna("nan").str.strip()
     print(f"    {len(df_letpub)} 条记录, {len(df_letpub.columns)} 列")
 
     print(f"[2] 读取 KD: {kd_path}")
-    df_kd = pd.read_csv(kd_path)
-    df_kd["项目批准号"] = df_kd["项目批准号"].astype(str).str.strip()
+    df_kd = pd.read_csv(kd_path, dtype={"项目批准号": str})
+    df_kd["项目批准号"] = df_kd["项目批准号"].fillna("nan").str.strip()
     df_kd = df_kd[df_kd["项目名称"] != "Not Found"]
     print(f"    {len(df_kd)} 条有效记录, {len(df_kd.columns)} 列")
 
@@ -34,19 +37,27 @@ def merge_nsfc_sources(letpub_path: str, kd_path: str, output_path: str):
     df_kd_subset = df_kd_subset.rename(columns={"项目批准号": "项目编号"})
 
     print(f"[3] 合并数据...")
-    df = df_letpub.merge(df_kd_subset, on="项目编号", how="left")
-
-    def pick_longer(row, col_a, col_b):
-        a = str(row.get(col_a, "") or "")
-        b = str(row.get(col_b, "") or "")
-        if a in ("nan", "None", ""):
-            a = ""
-        if b in ("nan", "None", ""):
-            b = ""
-        return a if len(a) >= len(b) else b
-
-    df["结题摘要_合并"] = df.apply(lambda r: pick_longer(r, "结题摘要_kd", "结题摘要"), axis=1)
-    df["中文摘要_合并"] = df.apply(lambda r: pick_longer(r, "中文摘要_kd", "申请摘要"), axis=1)
+    if df_kd_subset["项目编号"].is_unique:
+        # KD 侧键唯一时按索引对齐 join，复用索引哈希且不做防御性拷贝
+        df = df_letpub.join(df_kd_subset.set_index("项目编号"), on="项目编号",
+                            how="left", lsuffix="_x", rsuffix="_y")
+    else:
+        df = df_letpub.merge(df_kd_subset, on="项目编号", how="left", sort=False)
+
+    def pick_longer(col_a, col_b):
+        """逐行取两列中较长的文本 (向量化，空值及 "nan"/"None" 占位文本视为空串)"""
+        def clean(col):
+            if col not in df.columns:
+                return pd.Series("", index=df.index, dtype="string")
+            s = df[col].astype("string")
+            return s.mask(s.isna() | s.isin(["nan", "None"]), "")
+
+        a, b = clean(col_a), clean(col_b)
+        return np.where(a.str.len().to_numpy(dtype=np.int64) >= b.str.len().to_numpy(dtype=np.int64),
+                        a.to_numpy(dtype=object), b.to_numpy(dtype=object))
+
+    df["结题摘要_合并"] = pick_longer("结题摘要_kd", "结题摘要")
+    df["中文摘要_合并"] = pick_longer("中文摘要_kd", "申请摘要")
 
     final_columns = [
         "项目编号", "项目标题", "负责人", "单位", "所属学部", "项目类型",
@@ -68,8 +79,8 @@ def merge_nsfc_sources(letpub_path: str, kd_path: str, output_path: str):
     print(f"\n{'='*50}")
     print(f"合并完成: {total} 个项目")
     print(f"{'='*50}")
-    for col in df_final.columns:
-        filled = (df_final[col].astype(str).str.len() > 2).sum()
+    filled_counts = (df_final.astype(str).apply(lambda s: s.str.len()) > 2).sum()
+    for col, filled in filled_counts.items():
         pct = filled * 100 // total
         bar = "█" * (pct // 5) + "░" * (20 - pct // 5)
         print(f"  {col:12s}  {bar} {filled:>3d}/{total} ({pct}%)")
@@ -80,11 +91,21 @@ def merge_nsfc_sources(letpub_path: str, kd_path: str, output_path: str):
 def create_search_text(df: pd.DataFrame, columns: list[str], output_col: str = "text") -> pd.DataFrame:
     """拼接多列为可搜索文本"""
     df = df.copy()
-    df[output_col] = df[columns].fillna('').astype(str).agg(' '.join, axis=1)
+    if not columns:
+        df[output_col] = ''
+        return df
+    sub = df[columns].fillna('').astype(str)
+    df[output_col] = sub.iloc[:, 0].str.cat([sub.iloc[:, i] for i in range(1, sub.shape[1])], sep=' ')
     return df
 
 
+@lru_cache(maxsize=64)
+def _get_pattern(pattern: str) -> re.Pattern:
+    """编译并缓存忽略大小写的正则"""
+    return re.compile(pattern, re.I)
+
+
 def filter_by_pattern(df: pd.DataFrame, col: str, pattern: str, keep: bool = True) -> pd.DataFrame:
     """正则过滤行。keep=True保留匹配行，keep=False排除匹配行"""
-    mask = df[col].astype(str).str.contains(pattern, flags=re.I, na=False)
+    mask = df[col].astype(str).str.contains(_get_pattern(pattern), na=False)
     return df[mask] if keep else df[~mask]
@@ -17,28 +17,53 @@
     - 或使用 pytest --ignore 跳过依赖 matplotlib 的测试
 """
 
+import copy
+import re
 import sys
 from pathlib import Path
 
-# 绕过 scripts/__init__.py 的 matplotlib 导入
-sys.modules['scripts'] = type(sys)('scripts')
-sys.modules['scripts'].__path__ = [str(Path(__file__).parent.parent / 'scripts')]
+# 绕过 scripts/__init__.py 的 matplotlib 导入 (已加载时不覆盖)
+if 'scripts' not in sys.modules:
+    sys.modules['scripts'] = type(sys)('scripts')
+    sys.modules['scripts'].__path__ = [str(Path(__file__).parent.parent / 'scripts')]
 
 import pytest
+import numpy as np
 import pandas as pd
 from dataclasses import asdict
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from scripts.applicant import (
+    ApplicantProfile,
+    ApplicantAnalyzer,
+    quick_percentile,
+    get_benchmark_by_name,
+    apply_benchmark,
+    check_pubmed_data,
+    create_markdown_report,
+    create_profile_summary,
+    create_comparison_report,
+    get_quadrant_position,
+    analyze_weaknesses,
+    generate_narrative_assessment,
+    DEFAULT_SCORE_WEIGHTS,
+    FIT_DIMENSIONS,
+    COMPETENCY_DIMENSIONS,
+)
+
 
 # ═══════════════════════════════════════════════
 # Fixtures
 # ═══════════════════════════════════════════════
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_profile():
     """创建测试用的 ApplicantProfile"""
-    from scripts.applicant import ApplicantProfile
-
     return ApplicantProfile(
         name_cn='张三',
         name_en='San Zhang',
@@ -63,10 +88,19 @@ def sample_profile():
     )
 
 
-@pytest.fixture
+_SAMPLE_AUTHORS = (
+    'Zhang S; Li W; Wang X',
+    'Zhang San; Chen Y',
+    'Wang X; Zhang S',
+    'Li W; Zhang San; Chen Y',
+    'Zhang S',
+)
+
+
+@pytest.fixture(scope="module")
 def sample_df():
     """创建测试用的 PubMed DataFrame"""
-    return pd.DataFrame({
+    return pd.DataFrame.from_dict({
         'pmid': ['12345', '12346', '12347', '12348', '12349'],
         'title': [
             'TMS treatment for schizophrenia',
@@ -75,23 +109,15 @@ def sample_df():
             'Neural circuits in psychosis',
             'Cognitive rehabilitation study',
         ],
-        'authors': [
-            'Zhang S; Li W; Wang X',
-            'Zhang San; Chen Y',
-            'Wang X; Zhang S',
-            'Li W; Zhang San; Chen Y',
-            'Zhang S',
-        ],
+        'authors': list(_SAMPLE_AUTHORS),
         'journal': ['Brain Stimul', 'Neuroimage', 'Biol Psychiatry', 'J Neurosci', 'Cortex'],
-        'year': [2020, 2021, 2022, 2023, 2024],
-    })
+        'year': np.array([2020, 2021, 2022, 2023, 2024], dtype=np.int32),
+    }, orient='columns')
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_profile():
     """创建空的 ApplicantProfile"""
-    from scripts.applicant import ApplicantProfile
-
     return ApplicantProfile(
         name_cn='空',
         name_en='Empty',
@@ -161,10 +187,9 @@ class TestApplicantProfile:
 
     def test_to_json(self, sample_profile):
         """to_json 应返回有效的 JSON 字符串"""
-        import json
         json_str = sample_profile.to_json()
-        data = json.loads(json_str)
-        assert data['name_en'] == 'San Zhang'
+        assert json_str.startswith('{') and json_str.endswith('}')
+        assert json_loads(json_str)['name_en'] == 'San Zhang'
 
 
 # ═══════════════════════════════════════════════
@@ -175,10 +200,9 @@ class TestApplicantProfile:
 class TestAuthorMatching:
     """作者姓名匹配逻辑测试"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def analyzer(self):
         """创建分析器实例"""
-        from scripts.applicant import ApplicantAnalyzer
         return ApplicantAnalyzer()
 
     def test_exact_match(self, analyzer):
@@ -226,16 +250,12 @@ class TestBenchmark:
 
     def test_quick_percentile_basic(self):
         """快速百分位计算基本功能"""
-        from scripts.applicant import quick_percentile
-
         # 50 篇文献在 NIBS-Psychiatry 领域的百分位
         pct = quick_percentile(50, 'n_total')
         assert 0 <= pct <= 100
 
     def test_quick_percentile_extremes(self):
         """极端值的百分位计算"""
-        from scripts.applicant import quick_percentile
-
         # 很少的文献应该低百分位
         low_pct = quick_percentile(5, 'n_total')
         assert low_pct < 30
@@ -246,8 +266,6 @@ class TestBenchmark:
 
     def test_get_benchmark_by_name(self):
         """按名称获取基准"""
-        from scripts.applicant import get_benchmark_by_name
-
         bm = get_benchmark_by_name('NIBS-Psychiatry')
         assert bm.name == 'NIBS-Psychiatry'
 
@@ -256,16 +274,13 @@ class TestBenchmark:
 
     def test_get_benchmark_invalid_name(self):
         """无效基准名称应抛出异常"""
-        from scripts.applicant import get_benchmark_by_name
-
         with pytest.raises(ValueError):
             get_benchmark_by_name('invalid-benchmark')
 
     def test_apply_benchmark(self, sample_profile):
         """应用基准后 profile 应有百分位排名"""
-        from scripts.applicant import apply_benchmark
-
-        updated = apply_benchmark(sample_profile)
+        # apply_benchmark 原地写入 percentile_ranks，复制以免影响共享 fixture
+        updated = apply_benchmark(copy.deepcopy(sample_profile))
         assert updated.percentile_ranks
         assert 'n_total' in updated.percentile_ranks
         assert 'h_index' in updated.percentile_ranks
@@ -281,8 +296,6 @@ class TestDataQuality:
 
     def test_check_pubmed_data_dedup(self):
         """去重功能测试"""
-        from scripts.applicant import check_pubmed_data
-
         df = pd.DataFrame({
             'pmid': ['123', '123', '456'],  # 重复 PMID
             'title': ['A', 'A', 'B'],
@@ -295,8 +308,6 @@ class TestDataQuality:
 
     def test_check_pubmed_data_year_outlier(self):
         """年份异常值测试"""
-        from scripts.applicant import check_pubmed_data
-
         df = pd.DataFrame({
             'pmid': ['1', '2', '3'],
             'title': ['A', 'B', 'C'],
@@ -308,8 +319,6 @@ class TestDataQuality:
 
     def test_check_pubmed_data_empty_title(self):
         """空标题过滤测试"""
-        from scripts.applicant import check_pubmed_data
-
         df = pd.DataFrame({
             'pmid': ['1', '2', '3'],
             'title': ['Valid', '', None],
@@ -330,16 +339,12 @@ class TestReportGeneration:
 
     def test_create_markdown_report_not_empty(self, sample_profile):
         """Markdown 报告应非空"""
-        from scripts.applicant import create_markdown_report
-
         report = create_markdown_report(sample_profile, 'OFC-rTMS研究')
         assert len(report) > 500
         assert '# 申请人前期工作基础报告' in report
 
     def test_create_markdown_report_sections(self, sample_profile):
         """报告应包含主要章节"""
-        from scripts.applicant import create_markdown_report
-
         report = create_markdown_report(sample_profile)
 
         expected_sections = [
@@ -347,21 +352,19 @@ class TestReportGeneration:
             '## 2. 发表统计',
             '## 8. 申报者适配度与胜任力评估',
         ]
-        for section in expected_sections:
-            assert section in report, f"缺少章节: {section}"
+        pattern = re.compile('|'.join(map(re.escape, expected_sections)))
+        hits = {m.group() for m in pattern.finditer(report)}
+        missing = set(expected_sections) - hits
+        assert not missing, f"缺少章节: {missing}"
 
     def test_create_profile_summary(self, sample_profile):
         """纯文本摘要测试"""
-        from scripts.applicant import create_profile_summary
-
         summary = create_profile_summary(sample_profile)
         assert '张三' in summary
         assert '文献统计' in summary
 
     def test_create_comparison_report(self, sample_profile):
         """多申请人对比报告测试"""
-        from scripts.applicant import create_comparison_report, ApplicantProfile
-
         profile2 = ApplicantProfile(
             name_cn='李四',
             name_en='Si Li',
@@ -390,8 +393,6 @@ class TestAssessment:
 
     def test_get_quadrant_position(self, sample_profile):
         """象限定位测试"""
-        from scripts.applicant import get_quadrant_position
-
         pos = get_quadrant_position(sample_profile)
         assert 'label' in pos
         assert 'fit' in pos
@@ -400,8 +401,6 @@ class TestAssessment:
 
     def test_analyze_weaknesses(self, sample_profile):
         """薄弱维度分析测试"""
-        from scripts.applicant import analyze_weaknesses
-
         weaknesses = analyze_weaknesses(sample_profile)
         assert isinstance(weaknesses, list)
         # 如果有薄弱维度，应包含必要字段
@@ -412,8 +411,6 @@ class TestAssessment:
 
     def test_generate_narrative_assessment(self, sample_profile):
         """叙事性评估测试"""
-        from scripts.applicant import generate_narrative_assessment
-
         narrative = generate_narrative_assessment(sample_profile, 'OFC-rTMS研究')
         # 应返回字符串 (可能为空字符串)
         assert isinstance(narrative, str)
@@ -429,19 +426,11 @@ class TestScoreWeights:
 
     def test_default_weights_sum_to_one(self):
         """默认权重总和应为 1.0"""
-        from scripts.applicant import DEFAULT_SCORE_WEIGHTS
-
         total = sum(DEFAULT_SCORE_WEIGHTS.values())
         assert abs(total - 1.0) < 0.001, f"权重总和 {total} 不等于 1.0"
 
     def test_fit_competency_split(self):
         """适配度和胜任力应各占 50%"""
-        from scripts.applicant import (
-            DEFAULT_SCORE_WEIGHTS,
-            FIT_DIMENSIONS,
-            COMPETENCY_DIMENSIONS,
-        )
-
         fit_total = sum(DEFAULT_SCORE_WEIGHTS[d] for d in FIT_DIMENSIONS)
         comp_total = sum(DEFAULT_SCORE_WEIGHTS[d] for d in COMPETENCY_DIMENSIONS)
 
@@ -454,37 +443,42 @@ class TestScoreWeights:
 # ═══════════════════════════════════════════════
 
 
+_TEAM_AUTHORS = (
+    'Zhang S; Li W; Wang X',           # Team 1
+    'Zhang S; Li W; Wang X',           # Team 1 (重复)
+    'Zhang S; Chen Y',                 # 小团队
+    'Zhang S; Li W; Wang X; Zhou M',   # Team 1 扩展
+    'Zhang S; Liu R; Zhao Q',          # Team 2
+    'Zhang S; Liu R; Zhao Q',          # Team 2 (重复)
+)
+_TEAM_PATTERNS = ('zhang s', 'san zhang')
+
+
 class TestHypergraphCollaboration:
     """超图合作网络分析测试 (基于 Battiston et al. 2025)"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def analyzer(self):
         """创建分析器实例"""
-        from scripts.applicant import ApplicantAnalyzer
         return ApplicantAnalyzer()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def df_with_teams(self):
         """创建包含重复合作团队的测试数据"""
-        return pd.DataFrame({
+        return pd.DataFrame.from_dict({
             'pmid': ['1', '2', '3', '4', '5', '6'],
             'title': ['Paper A', 'Paper B', 'Paper C', 'Paper D', 'Paper E', 'Paper F'],
-            'authors': [
-                'Zhang S; Li W; Wang X',           # Team 1
-                'Zhang S; Li W; Wang X',           # Team 1 (重复)
-                'Zhang S; Chen Y',                 # 小团队
-                'Zhang S; Li W; Wang X; Zhou M',   # Team 1 扩展
-                'Zhang S; Liu R; Zhao Q',          # Team 2
-                'Zhang S; Liu R; Zhao Q',          # Team 2 (重复)
-            ],
-            'year': [2020, 2021, 2022, 2022, 2023, 2024],
-        })
+            'authors': list(_TEAM_AUTHORS),
+            'year': np.array([2020, 2021, 2022, 2022, 2023, 2024], dtype=np.int32),
+        }, orient='columns')
 
-    def test_extract_hyperedges(self, analyzer, df_with_teams):
-        """超边提取测试"""
-        patterns = ['zhang s', 'san zhang']
-        hyperedges = analyzer._extract_collaboration_hyperedges(df_with_teams, patterns)
+    @pytest.fixture(scope="module")
+    def hyperedges(self, analyzer, df_with_teams):
+        """提取一次超边，供下游测试复用"""
+        return analyzer._extract_collaboration_hyperedges(df_with_teams, _TEAM_PATTERNS)
 
+    def test_extract_hyperedges(self, hyperedges):
+        """超边提取测试"""
         # 应该检测到重复的合作组合
         assert len(hyperedges) >= 1, "应检测到至少一个重复超边"
 
@@ -492,10 +486,8 @@ class TestHypergraphCollaboration:
         top_edge, top_count = hyperedges[0]
         assert top_count >= 2, f"最频繁团队应出现至少2次, 实际 {top_count}"
 
-    def test_detect_stable_teams(self, analyzer, df_with_teams):
+    def test_detect_stable_teams(self, analyzer, hyperedges):
         """稳定团队检测测试"""
-        patterns = ['zhang s', 'san zhang']
-        hyperedges = analyzer._extract_collaboration_hyperedges(df_with_teams, patterns)
         teams = analyzer._detect_stable_teams(hyperedges, min_size=2, max_size=5)
 
         # 应检测到稳定团队
@@ -507,15 +499,13 @@ class TestHypergraphCollaboration:
 
     def test_stability_index(self, analyzer, df_with_teams):
         """团队稳定性指数测试"""
-        patterns = ['zhang s', 'san zhang']
-        stability = analyzer._compute_team_stability_index(df_with_teams, patterns)
+        stability = analyzer._compute_team_stability_index(df_with_teams, _TEAM_PATTERNS)
 
         assert 0 <= stability <= 1, f"稳定性指数应在 0-1 之间, 实际 {stability}"
 
     def test_collaboration_structure(self, analyzer, df_with_teams):
         """合作结构分析测试"""
-        patterns = ['zhang s', 'san zhang']
-        structure = analyzer._analyze_collaboration_structure(df_with_teams, patterns)
+        structure = analyzer._analyze_collaboration_structure(df_with_teams, _TEAM_PATTERNS)
 
         expected_keys = ['hyperedges', 'stable_teams', 'stability_index',
                          'avg_team_size', 'max_team_size', 'solo_ratio']
@@ -6,85 +6,120 @@
 """
 
 import sys
-import pytest
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
 
-# 绕过 scripts/__init__.py 的 matplotlib 导入问题
-sys.modules['scripts'] = type(sys)('scripts')
-sys.modules['scripts'].__path__ = ['scripts']
+import pytest
 
-# 检测 matplotlib 是否可用
-try:
-    import matplotlib.pyplot as plt
-    MATPLOTLIB_AVAILABLE = True
-except (ImportError, AttributeError):
-    MATPLOTLIB_AVAILABLE = False
+# 绕过 scripts/__init__.py 的 matplotlib 导入问题 (已加载时不覆盖)
+if 'scripts' not in sys.modules:
+    sys.modules['scripts'] = type(sys)('scripts')
+    sys.modules['scripts'].__path__ = [str(Path(__file__).parent.parent / 'scripts')]
 
-requires_matplotlib = pytest.mark.skipif(
-    not MATPLOTLIB_AVAILABLE,
-    reason="matplotlib 与 NumPy 2.x 不兼容"
+from scripts.plotting.colors import (
+    COLORS_GREEN_PURPLE,
+    CAT_COLORS,
+    APPLICANT_COLORS,
+    QUADRANT_COLORS,
 )
 
+# 检测 matplotlib 是否可用: 收集阶段只查元数据，不导入 pyplot
+MATPLOTLIB_AVAILABLE = find_spec('matplotlib') is not None
+
+
+@pytest.fixture(scope="session")
+def _mpl():
+    """首次需要时导入 matplotlib (强制 Agg 后端)，与 NumPy 2.x 不兼容时跳过"""
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except (ImportError, AttributeError):
+        pytest.skip("matplotlib 与 NumPy 2.x 不兼容")
+    return plt
+
+
+def requires_matplotlib(cls):
+    """标记需要 matplotlib 的测试类"""
+    cls = pytest.mark.usefixtures('_mpl')(cls)
+    return pytest.mark.skipif(not MATPLOTLIB_AVAILABLE, reason="未安装 matplotlib")(cls)
+
+
+@lru_cache(maxsize=None)
+def _composed():
+    """组合所有 Mixin 的测试类 (模拟 LandscapePlot)，仅构建一次"""
+    from scripts.plotting.base import BasePlotMixin
+    from scripts.plotting.landscape import LandscapePlotMixin
+    from scripts.plotting.keywords import KeywordPlotMixin
+    from scripts.plotting.bibliometric import BibliometricPlotMixin
+    from scripts.plotting.network import NetworkPlotMixin
+    from scripts.plotting.applicant import ApplicantPlotMixin
+
+    class TestPlot(
+        ApplicantPlotMixin,
+        NetworkPlotMixin,
+        BibliometricPlotMixin,
+        KeywordPlotMixin,
+        LandscapePlotMixin,
+        BasePlotMixin,
+    ):
+        pass
+
+    return TestPlot
+
+
+@lru_cache(maxsize=None)
+def _all_attrs(cls) -> frozenset:
+    """展开 MRO 上所有类属性名，一次计算后做集合成员测试"""
+    attrs = set()
+    for c in cls.__mro__:
+        attrs.update(vars(c))
+    return frozenset(attrs)
+
 
 class TestColorConstants:
     """测试色板常量 (无 matplotlib 依赖)"""
 
     def test_import_colors(self):
         """测试色板常量导入"""
-        from scripts.plotting.colors import (
-            COLORS_GREEN_PURPLE,
-            CAT_COLORS,
-            APPLICANT_COLORS,
-            QUADRANT_COLORS,
-        )
         assert 'ACCENT' in COLORS_GREEN_PURPLE
         assert 'BG' in COLORS_GREEN_PURPLE
         assert '神经调控' in CAT_COLORS
         assert 'fit' in APPLICANT_COLORS
         assert '明星' in QUADRANT_COLORS
 
-    def test_colors_are_hex(self):
+    @pytest.mark.parametrize('name,color', list(COLORS_GREEN_PURPLE.items()))
+    def test_colors_are_hex(self, name, color):
         """测试颜色值为有效十六进制"""
-        from scripts.plotting.colors import COLORS_GREEN_PURPLE, CAT_COLORS
+        assert color.startswith('#'), f"{name} 不是十六进制颜色"
+        assert len(color) == 7, f"{name} 长度不对"
 
-        for name, color in COLORS_GREEN_PURPLE.items():
-            assert color.startswith('#'), f"{name} 不是十六进制颜色"
-            assert len(color) == 7, f"{name} 长度不对"
+    @pytest.mark.parametrize('name,color', list(CAT_COLORS.items()))
+    def test_category_colors_are_hex(self, name, color):
+        """测试类别颜色值为十六进制"""
+        assert color.startswith('#'), f"{name} 不是十六进制颜色"
 
-        for name, color in CAT_COLORS.items():
-            assert color.startswith('#'), f"{name} 不是十六进制颜色"
-
-    def test_required_colors_exist(self):
+    @pytest.mark.parametrize('color', ['ACCENT', 'BG', 'INDIGO', 'VIOLET', 'WARN'])
+    def test_required_colors_exist(self, color):
         """测试必需的颜色存在"""
-        from scripts.plotting.colors import COLORS_GREEN_PURPLE
-
-        required = ['ACCENT', 'BG', 'INDIGO', 'VIOLET', 'WARN']
-        for color in required:
-            assert color in COLORS_GREEN_PURPLE, f"缺少必需颜色: {color}"
+        assert color in COLORS_GREEN_PURPLE, f"缺少必需颜色: {color}"
 
-    def test_category_colors_complete(self):
+    @pytest.mark.parametrize('cat', ['神经调控', '环路/机制', '免疫/代谢', '神经影像',
+                                     '遗传/组学', '临床/药物', '认知/行为', '其他'])
+    def test_category_colors_complete(self, cat):
         """测试研究方向分类颜色完整"""
-        from scripts.plotting.colors import CAT_COLORS
+        assert cat in CAT_COLORS, f"缺少类别颜色: {cat}"
 
-        categories = ['神经调控', '环路/机制', '免疫/代谢', '神经影像',
-                      '遗传/组学', '临床/药物', '认知/行为', '其他']
-        for cat in categories:
-            assert cat in CAT_COLORS, f"缺少类别颜色: {cat}"
-
-    def test_applicant_colors_complete(self):
+    @pytest.mark.parametrize('key', ['fit', 'competency', 'combined', 'highlight', 'neutral'])
+    def test_applicant_colors_complete(self, key):
         """测试申请人评估用色完整"""
-        from scripts.plotting.colors import APPLICANT_COLORS
-
-        required = ['fit', 'competency', 'combined', 'highlight', 'neutral']
-        for key in required:
-            assert key in APPLICANT_COLORS, f"缺少申请人颜色: {key}"
+        assert key in APPLICANT_COLORS, f"缺少申请人颜色: {key}"
 
-    def test_quadrant_colors_complete(self):
+    @pytest.mark.parametrize('q', ['明星', '潜力', '实力', '发展'])
+    def test_quadrant_colors_complete(self, q):
         """测试象限颜色完整"""
-        from scripts.plotting.colors import QUADRANT_COLORS
-
-        quadrants = ['明星', '潜力', '实力', '发展']
-        for q in quadrants:
-            assert q in QUADRANT_COLORS, f"缺少象限颜色: {q}"
+        assert q in QUADRANT_COLORS, f"缺少象限颜色: {q}"
 
 
 class TestPackageStructure:
@@ -122,6 +157,29 @@ class TestPackageStructure:
             assert key in _lazy_imports, f"_lazy_imports 缺少: {key}"
 
 
+class TestHeatmapKernel:
+    """测试热力图标注分类内核 (无 matplotlib 依赖)"""
+
+    def test_classify_cells(self):
+        """测试单元格颜色类别与截断整数值"""
+        import numpy as np
+        from scripts.plotting._heatmap_kernel import classify_cells, DARK, WHITE, ACCENT
+
+        heat = np.array([[1.7, 9.0, 4.0],
+                         [6.2, 0.0, 3.0]])
+        vals, classes = classify_cells(heat, highlight_col=2)
+        assert vals.tolist() == [[1, 9, 4], [6, 0, 3]]
+        assert classes.tolist() == [[DARK, WHITE, ACCENT], [WHITE, DARK, ACCENT]]
+
+    def test_classify_cells_no_highlight(self):
+        """测试不高亮时无强调色"""
+        import numpy as np
+        from scripts.plotting._heatmap_kernel import classify_cells, ACCENT
+
+        _, classes = classify_cells(np.arange(12).reshape(3, 4), highlight_col=-1)
+        assert not (classes == ACCENT).any()
+
+
 @requires_matplotlib
 class TestPlottingImports:
     """测试 plotting 包导入 (需要 matplotlib)"""
@@ -129,121 +187,105 @@ class TestPlottingImports:
     def test_import_base_mixin(self):
         """测试 BasePlotMixin 导入"""
         from scripts.plotting.base import BasePlotMixin
-        assert hasattr(BasePlotMixin, '__init__')
-        assert hasattr(BasePlotMixin, 'save_figure')
-        assert hasattr(BasePlotMixin, 'plot_top_bar')
-        assert hasattr(BasePlotMixin, 'setup_chinese_fonts')
+        expected = {
+            '__init__',
+            'save_figure',
+            'plot_top_bar',
+            'setup_chinese_fonts',
+        }
+        missing = expected - _all_attrs(BasePlotMixin)
+        assert not missing, f"Missing: {missing}"
 
     def test_import_landscape_mixin(self):
         """测试 LandscapePlotMixin 导入"""
         from scripts.plotting.landscape import LandscapePlotMixin
-        assert hasattr(LandscapePlotMixin, 'plot_trend')
-        assert hasattr(LandscapePlotMixin, 'plot_stacked_evolution')
-        assert hasattr(LandscapePlotMixin, 'plot_heatmap_with_marginals')
-        assert hasattr(LandscapePlotMixin, 'create_landscape')
-        assert hasattr(LandscapePlotMixin, 'create_supplementary_figure')
+        expected = {
+            'plot_trend',
+            'plot_stacked_evolution',
+            'plot_heatmap_with_marginals',
+            'create_landscape',
+            'create_supplementary_figure',
+        }
+        missing = expected - _all_attrs(LandscapePlotMixin)
+        assert not missing, f"Missing: {missing}"
 
     def test_import_keywords_mixin(self):
         """测试 KeywordPlotMixin 导入"""
         from scripts.plotting.keywords import KeywordPlotMixin
-        assert hasattr(KeywordPlotMixin, 'plot_temporal_network')
-        assert hasattr(KeywordPlotMixin, 'plot_keyword_prediction')
-        assert hasattr(KeywordPlotMixin, 'plot_thematic_map_temporal')
+        expected = {
+            'plot_temporal_network',
+            'plot_keyword_prediction',
+            'plot_thematic_map_temporal',
+        }
+        missing = expected - _all_attrs(KeywordPlotMixin)
+        assert not missing, f"Missing: {missing}"
 
     def test_import_bibliometric_mixin(self):
         """测试 BibliometricPlotMixin 导入"""
         from scripts.plotting.bibliometric import BibliometricPlotMixin
-        assert hasattr(BibliometricPlotMixin, 'plot_lotka')
-        assert hasattr(BibliometricPlotMixin, 'plot_bradford')
-        assert hasattr(BibliometricPlotMixin, 'plot_funding_trend')
-        assert hasattr(BibliometricPlotMixin, 'create_bibliometric_report')
+        expected = {
+            'plot_lotka',
+            'plot_bradford',
+            'plot_funding_trend',
+            'create_bibliometric_report',
+        }
+        missing = expected - _all_attrs(BibliometricPlotMixin)
+        assert not missing, f"Missing: {missing}"
 
     def test_import_network_mixin(self):
         """测试 NetworkPlotMixin 导入"""
         from scripts.plotting.network import NetworkPlotMixin
-        assert hasattr(NetworkPlotMixin, 'plot_network')
-        assert hasattr(NetworkPlotMixin, 'plot_thematic_map')
-        assert hasattr(NetworkPlotMixin, 'plot_centrality_bar')
-        assert hasattr(NetworkPlotMixin, 'create_network_report')
+        expected = {
+            'plot_network',
+            'plot_thematic_map',
+            'plot_centrality_bar',
+            'create_network_report',
+        }
+        missing = expected - _all_attrs(NetworkPlotMixin)
+        assert not missing, f"Missing: {missing}"
 
     def test_import_applicant_mixin(self):
         """测试 ApplicantPlotMixin 导入"""
         from scripts.plotting.applicant import ApplicantPlotMixin
-        assert hasattr(ApplicantPlotMixin, 'create_applicant_figure')
-        assert hasattr(ApplicantPlotMixin, 'create_applicant_extended_figure')
-        assert hasattr(ApplicantPlotMixin, 'create_comparison_figure')
+        expected = {
+            'create_applicant_figure',
+            'create_applicant_extended_figure',
+            'create_comparison_figure',
+        }
+        missing = expected - _all_attrs(ApplicantPlotMixin)
+        assert not missing, f"Missing: {missing}"
 
 
 @requires_matplotlib
 class TestMixinComposition:
     """测试 Mixin 组合 (需要 matplotlib)"""
 
-    def test_landscape_plot_inherits_all_mixins(self):
+    @pytest.mark.parametrize('mixin', [
+        'ApplicantPlotMixin', 'NetworkPlotMixin', 'BibliometricPlotMixin',
+        'KeywordPlotMixin', 'LandscapePlotMixin', 'BasePlotMixin',
+    ])
+    def test_landscape_plot_inherits_all_mixins(self, mixin):
         """测试 LandscapePlot 继承所有 Mixin"""
-        from scripts.plotting.base import BasePlotMixin
-        from scripts.plotting.landscape import LandscapePlotMixin
-        from scripts.plotting.keywords import KeywordPlotMixin
-        from scripts.plotting.bibliometric import BibliometricPlotMixin
-        from scripts.plotting.network import NetworkPlotMixin
-        from scripts.plotting.applicant import ApplicantPlotMixin
-
-        # 创建组合类 (模拟 LandscapePlot)
-        class TestPlot(
-            ApplicantPlotMixin,
-            NetworkPlotMixin,
-            BibliometricPlotMixin,
-            KeywordPlotMixin,
-            LandscapePlotMixin,
-            BasePlotMixin,
-        ):
-            pass
-
-        # 验证 MRO
-        mro_names = [cls.__name__ for cls in TestPlot.__mro__]
-        assert 'ApplicantPlotMixin' in mro_names
-        assert 'NetworkPlotMixin' in mro_names
-        assert 'BibliometricPlotMixin' in mro_names
-        assert 'KeywordPlotMixin' in mro_names
-        assert 'LandscapePlotMixin' in mro_names
-        assert 'BasePlotMixin' in mro_names
-
-    def test_landscape_plot_has_all_methods(self):
-        """测试 LandscapePlot 拥有所有方法"""
-        from scripts.plotting.base import BasePlotMixin
-        from scripts.plotting.landscape import LandscapePlotMixin
-        from scripts.plotting.keywords import KeywordPlotMixin
-        from scripts.plotting.bibliometric import BibliometricPlotMixin
-        from scripts.plotting.network import NetworkPlotMixin
-        from scripts.plotting.applicant import ApplicantPlotMixin
-
-        class TestPlot(
-            ApplicantPlotMixin,
-            NetworkPlotMixin,
-            BibliometricPlotMixin,
-            KeywordPlotMixin,
-            LandscapePlotMixin,
-            BasePlotMixin,
-        ):
-            pass
-
-        # 关键方法检查
-        key_methods = [
-            # Base
-            'save_figure', 'plot_top_bar',
-            # Landscape
-            'create_landscape', 'plot_trend', 'plot_gap_table',
-            # Keywords
-            'plot_temporal_network',
-            # Bibliometric
-            'plot_lotka', 'plot_bradford',
-            # Network
-            'plot_network', 'create_network_report',
-            # Applicant
-            'create_applicant_figure', 'create_comparison_figure',
-        ]
-
-        for method in key_methods:
-            assert hasattr(TestPlot, method), f"Missing method: {method}"
+        mro_names = [cls.__name__ for cls in _composed().__mro__]
+        assert mixin in mro_names
+
+    @pytest.mark.parametrize('method', [
+        # Base
+        'save_figure', 'plot_top_bar',
+        # Landscape
+        'create_landscape', 'plot_trend', 'plot_gap_table',
+        # Keywords
+        'plot_temporal_network',
+        # Bibliometric
+        'plot_lotka', 'plot_bradford',
+        # Network
+        'plot_network', 'create_network_report',
+        # Applicant
+        'create_applicant_figure', 'create_comparison_figure',
+    ])
+    def test_landscape_plot_has_all_methods(self, method):
+        """测试 LandscapePlot 拥有所有关键方法"""
+        assert method in _all_attrs(_composed()), f"Missing method: {method}"
 
 
 @requires_matplotlib
@@ -282,6 +324,48 @@ class TestBasePlotMixin:
         assert default_color == '#D5D8DC'
 
 
+@requires_matplotlib
+class TestNetworkPlotMixin:
+    """测试 NetworkPlotMixin 功能 (需要 matplotlib)"""
+
+    def test_spring_layout_cached(self):
+        """测试相同图结构复用布局"""
+        nx = pytest.importorskip('networkx')
+        from scripts.plotting.network import NetworkPlotMixin
+
+        mixin = NetworkPlotMixin()
+        G = nx.path_graph(['a', 'b', 'c', 'd'])
+        pos = mixin._spring_layout(G)
+        assert set(pos) == set(G.nodes())
+        assert mixin._spring_layout(G.copy()) is pos
+
+        G.add_edge('d', 'e')
+        assert mixin._spring_layout(G) is not pos
+
+    def test_network_report_rasterizes_edges_for_pdf(self, monkeypatch, _mpl):
+        """测试输出 PDF 时网络边 LineCollection 被栅格化"""
+        nx = pytest.importorskip('networkx')
+        from matplotlib.collections import LineCollection
+
+        plotter = _composed()()
+        axes = []
+        original = plotter.plot_network
+
+        def spy(ax, *args, **kwargs):
+            original(ax, *args, **kwargs)
+            axes.append(ax)
+
+        monkeypatch.setattr(plotter, 'plot_network', spy)
+        # 只检查图形对象，跳过实际写文件
+        monkeypatch.setattr(plotter, 'save_figure', lambda fig, *a, **kw: _mpl.close(fig))
+        G = nx.path_graph(['a', 'b', 'c', 'd'])
+        for formats, expected in ((('png',), False), (('png', 'pdf'), True)):
+            axes.clear()
+            plotter.create_network_report({'collab_graph': G}, 'unused', formats=formats)
+            edges = [c for c in axes[0].collections if isinstance(c, LineCollection)]
+            assert edges and all(c.get_rasterized() is expected for c in edges)
+
+
 @requires_matplotlib
 class TestBackwardCompatibility:
     """测试后向兼容性 (需要 matplotlib)"""
@@ -306,20 +390,18 @@ class TestBackwardCompatibility:
         assert plotter.lang == 'zh'
         assert hasattr(plotter, 'C')
 
-    def test_landscape_plot_has_create_methods(self):
+    @pytest.mark.parametrize('method', [
+        'create_landscape',
+        'create_supplementary_figure',
+        'create_bibliometric_report',
+        'create_performance_report',
+        'create_network_report',
+        'create_applicant_figure',
+        'create_applicant_extended_figure',
+        'create_comparison_figure',
+    ])
+    def test_landscape_plot_has_create_methods(self, method):
         """测试 LandscapePlot 有所有 create 方法"""
         from scripts.plot import LandscapePlot
 
-        create_methods = [
-            'create_landscape',
-            'create_supplementary_figure',
-            'create_bibliometric_report',
-            'create_performance_report',
-            'create_network_report',
-            'create_applicant_figure',
-            'create_applicant_extended_figure',
-            'create_comparison_figure',
-        ]
-
-        for method in create_methods:
-            assert hasattr(LandscapePlot, method), f"Missing: {method}"
+        assert method in _all_attrs(LandscapePlot), f"Missing: {method}"
@@ -17,12 +17,15 @@ zbib — 文献情报学空白挖掘工具 v2.3
     python zbib.py report projects/xxx
 """
 
+from __future__ import annotations
+
 import sys
-import argparse
 from pathlib import Path
 
-# 确保可以导入 scripts
-sys.path.insert(0, str(Path(__file__).parent))
+_HERE = Path(__file__).resolve().parent
+
+# 确保可以导入 scripts (scripts/__init__.py 按需导入子模块，无需预加载)
+sys.path.insert(0, str(_HERE))
 
 
 def cmd_new(args):
@@ -34,8 +37,8 @@ def cmd_new(args):
 def cmd_run(args):
     """运行分析流程"""
     if not args.config:
-        print("错误: 请指定配置文件")
-        print("用法: python zbib.py run <config.yaml>")
+        print("错误: 请指定配置文件\n"
+              "用法: python zbib.py run <config.yaml>")
         return 1
 
     config_path = Path(args.config)
@@ -51,9 +54,12 @@ def cmd_run(args):
     elif args.skip_fetch:
         pipeline.run(skip_fetch=True)
     else:
-        # 需要 LetPub 账号
-        email = args.email or input("LetPub 邮箱: ")
-        password = args.password or input("LetPub 密码: ")
+        # 需要 LetPub 账号: 命令行参数 > 环境变量 > 交互输入
+        import os
+        import getpass
+        email = args.email or os.environ.get('ZBIB_LETPUB_EMAIL') or input("LetPub 邮箱: ")
+        password = (args.password or os.environ.get('ZBIB_LETPUB_PASSWORD')
+                    or getpass.getpass("LetPub 密码: "))
         pipeline.run(email=email, password=password)
 
     return 0
@@ -61,10 +67,6 @@ def cmd_run(args):
 
 def cmd_diagnose(args):
     """诊断项目"""
-    import types
-    sys.modules['scripts'] = types.ModuleType('scripts')
-    sys.modules['scripts'].__path__ = [str(Path(__file__).parent / 'scripts')]
-
     from scripts.diagnostic import diagnose_project, print_diagnostic
 
     project_dir = args.project or '.'
@@ -76,10 +78,6 @@ def cmd_diagnose(args):
 
 def cmd_report(args):
     """生成报告"""
-    import types
-    sys.modules['scripts'] = types.ModuleType('scripts')
-    sys.modules['scripts'].__path__ = [str(Path(__file__).parent / 'scripts')]
-
     from scripts.report_generator import generate_full_report
 
     project_dir = args.project or '.'
@@ -91,43 +89,215 @@ def cmd_report(args):
     return 0
 
 
-def cmd_kg(args):
-    """生成知识图谱"""
-    import types
-    sys.modules['scripts'] = types.ModuleType('scripts')
-    sys.modules['scripts'].__path__ = [str(Path(__file__).parent / 'scripts')]
+# KnowledgeGraph.build_from_papers 实际读取的列 (概念 / 作者 / 标题补充 / 年份)
+_KG_COLUMNS = ('keywords', 'mesh', 'authors', 'title', 'year')
 
+# 超过此大小的 .gz 文件优先用 rapidgzip 并行解压
+_RAPIDGZIP_MIN_BYTES = 50_000_000
+
+
+def _read_kg_csv(path: Path, compression: str | None):
+    """
+    只读取知识图谱需要的列，文本列使用 string dtype.
+
+    先读表头取 _KG_COLUMNS 与实际列的交集，再依次尝试 polars (多线程，
+    需同时安装 pyarrow)、pandas pyarrow 引擎，最后回退到 C 引擎。大于 50 MB 的 gzip 文件在安装了
+    rapidgzip 时改用其多线程解码器，否则走 pandas 内置的单线程 gzip。
+
+    Args:
+        path: CSV / CSV.gz 文件路径
+        compression: 'gzip' 或 None
+
+    Returns:
+        DataFrame
+    """
     import pandas as pd
-    from scripts.knowledge_graph import KnowledgeGraph
 
+    source = path
+    if compression == 'gzip' and path.stat().st_size > _RAPIDGZIP_MIN_BYTES:
+        try:
+            import os
+            import rapidgzip
+            source = rapidgzip.open(str(path), parallelization=os.cpu_count())
+            compression = None
+        except ImportError:
+            pass
+
+    try:
+        header = pd.read_csv(source, compression=compression, nrows=0).columns
+        usecols = [c for c in _KG_COLUMNS if c in header] or None
+        dtype = {c: 'string' for c in (usecols or ()) if c != 'year'}
+        if source is not path:
+            source.seek(0)
+
+        # polars 的 to_pandas() 依赖 pyarrow，两者都在时才走 polars
+        from importlib.util import find_spec
+        if find_spec('polars') is not None and find_spec('pyarrow') is not None:
+            import polars as pl
+            try:
+                df = pl.read_csv(source, columns=usecols,
+                                 schema_overrides={c: pl.Utf8 for c in dtype})
+                return df.to_pandas().astype(dtype)
+            except (pl.exceptions.PolarsError, ImportError, TypeError):
+                # polars 对不规整的 CSV 更严格 (旧版本也不支持 schema_overrides)，
+                # 失败时交给 pandas
+                if source is not path:
+                    source.seek(0)
+
+        try:
+            return pd.read_csv(source, compression=compression, usecols=usecols,
+                               dtype=dtype, engine='pyarrow')
+        except (ImportError, ValueError):
+            # 未安装 pyarrow，或其拒绝不规整的 CSV (ArrowInvalid 为 ValueError 子类)
+            if source is not path:
+                source.seek(0)
+            return pd.read_csv(source, compression=compression, usecols=usecols,
+                               dtype=dtype, engine='c', low_memory=False)
+    finally:
+        if source is not path:
+            source.close()
+
+
+def _load_kg_frame(path: Path, cache_dir: Path):
+    """
+    读取 kg 数据文件，并在 cache_dir 下维护 Parquet 副本.
+
+    副本比源文件新时直接读取副本，跳过 CSV 解析；否则解析 CSV 后重写副本。
+    未安装 Parquet 引擎 (pyarrow / fastparquet) 时退化为每次解析 CSV。
+
+    cache_dir 不能位于 data/ 内: 在其中建目录会改变 data/ 的 mtime，
+    使 .zbib_cache.json 中记录的数据文件失效。
+
+    Args:
+        path: CSV / CSV.gz 文件路径
+        cache_dir: 副本目录 (项目目录下的 .cache)
+
+    Returns:
+        DataFrame
+    """
+    from importlib.util import find_spec
+
+    compression = 'gzip' if path.suffix == '.gz' else None
+    if find_spec('pyarrow') is None and find_spec('fastparquet') is None:
+        return _read_kg_csv(path, compression)
+
+    import pandas as pd
+
+    cache_path = cache_dir / f'{path.name}.parquet'
+    try:
+        if cache_path.stat().st_mtime_ns > path.stat().st_mtime_ns:
+            return pd.read_parquet(cache_path)
+    except (OSError, ValueError):
+        pass
+
+    df = _read_kg_csv(path, compression)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, compression='zstd')
+    except (OSError, ImportError, ValueError):
+        pass
+    return df
+
+
+# kg 数据文件搜索模式，按优先级排列
+_KG_DATA_PATTERNS = (
+    'applicant_*.csv.gz',
+    'applicant_*.csv',
+    'pubmed*.csv',
+    'nih_tms*.csv',
+    'nih_nibs*.csv',
+)
+
+# 记录上次解析到的 kg 数据文件 (位于项目目录下)
+_KG_CACHE_NAME = '.zbib_cache.json'
+
+
+def _find_kg_data(data_dir: Path) -> Path | None:
+    """
+    在 data_dir 中按 _KG_DATA_PATTERNS 优先级查找数据文件，同优先级取最大者.
+
+    Args:
+        data_dir: 数据目录
+
+    Returns:
+        数据文件路径，未找到时返回 None
+    """
+    import os
+    import re
+    import fnmatch
+
+    # 单次扫描目录: 每个文件取其命中的最高优先级模式，按 (优先级, -大小) 选最优
+    compiled = [re.compile(fnmatch.translate(p)) for p in _KG_DATA_PATTERNS]
+    best = None
+    try:
+        with os.scandir(data_dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                for priority, regex in enumerate(compiled):
+                    if regex.match(entry.name):
+                        key = (priority, -entry.stat().st_size)
+                        if best is None or key < best[0]:
+                            best = (key, entry.path)
+                        break
+    except FileNotFoundError:
+        return None
+    return Path(best[1]) if best is not None else None
+
+
+def _load_kg_cache(project_dir: Path, data_dir: Path) -> Path | None:
+    """读取缓存的数据文件路径；文件或 data/ 目录的 mtime 变化时视为失效"""
+    import json
+    try:
+        cache = json.loads((project_dir / _KG_CACHE_NAME).read_text(encoding='utf-8'))
+        f = data_dir / cache['data_file']
+        if (f.stat().st_mtime_ns == cache['mtime_ns']
+                and data_dir.stat().st_mtime_ns == cache['dir_mtime_ns']):
+            return f
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_kg_cache(project_dir: Path, data_dir: Path, data_file: Path):
+    """记录本次解析到的数据文件 (写入失败时忽略)"""
+    import json
+    cache = {
+        'data_file': data_file.name,
+        'mtime_ns': data_file.stat().st_mtime_ns,
+        'dir_mtime_ns': data_dir.stat().st_mtime_ns,
+    }
+    try:
+        (project_dir / _KG_CACHE_NAME).write_text(json.dumps(cache), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def cmd_kg(args):
+    """生成知识图谱"""
     project_dir = Path(args.project or '.')
     data_dir = project_dir / 'data'
     figs_dir = project_dir / 'figs'
-    figs_dir.mkdir(exist_ok=True)
-
-    # 查找数据文件 — 按优先级尝试多种模式
-    df = None
-    search_patterns = [
-        'applicant_*.csv.gz',
-        'applicant_*.csv',
-        'pubmed*.csv',
-        'nih_tms*.csv',
-        'nih_nibs*.csv',
-    ]
-    for pattern in search_patterns:
-        matches = sorted(data_dir.glob(pattern), key=lambda f: f.stat().st_size, reverse=True)
-        if matches:
-            f = matches[0]
-            compression = 'gzip' if f.suffix == '.gz' else None
-            df = pd.read_csv(f, compression=compression)
-            print(f"[Data] 加载 {len(df)} 条记录: {f.name}")
-            break
-
-    if df is None:
-        print(f"错误: 在 {data_dir} 中未找到数据文件")
-        print(f"  支持的文件: {', '.join(search_patterns)}")
+
+    # 查找数据文件 — 优先复用上次解析结果 (数据文件及 data/ 目录均未变动时)
+    f = _load_kg_cache(project_dir, data_dir)
+    if f is None:
+        f = _find_kg_data(data_dir)
+        if f is not None:
+            _save_kg_cache(project_dir, data_dir, f)
+
+    # 未找到数据时直接退出，不导入 pandas / KnowledgeGraph
+    if f is None:
+        print(f"错误: 在 {data_dir} 中未找到数据文件\n"
+              f"  支持的文件: {', '.join(_KG_DATA_PATTERNS)}")
         return 1
 
+    df = _load_kg_frame(f, project_dir / '.cache')
+    print(f"[Data] 加载 {len(df)} 条记录: {f.name}")
+
+    from scripts.knowledge_graph import KnowledgeGraph
+    if not figs_dir.is_dir():
+        figs_dir.mkdir(parents=True, exist_ok=True)
     kg = KnowledgeGraph()
     # 使用 keywords 和 mesh 双列，auto_adjust 会根据数据量调整阈值
     kg.build_from_papers(df, concept_col=['keywords', 'mesh'])
@@ -137,78 +307,105 @@ def cmd_kg(args):
     return 0
 
 
-def cmd_version(args):
-    """显示版本"""
-    print("""
+_BANNER = """
 ╔═══════════════════════════════════════════════════╗
 ║  zbib — 文献情报学空白挖掘工具                      ║
 ║  版本: 2.3                                         ║
 ║  功能: 研究空白分析 | 申请人评估 | 知识图谱          ║
 ╚═══════════════════════════════════════════════════╝
-""")
+
+"""
+
+
+def cmd_version(args):
+    """显示版本"""
+    sys.stdout.write(_BANNER)
     return 0
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='zbib — 文献情报学空白挖掘工具 v2.3',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def _add_run(parser):
+    parser.add_argument('config', nargs='?', help='配置文件路径')
+    parser.add_argument('--step', type=int, help='只运行指定步骤')
+    parser.add_argument('--skip-fetch', action='store_true', help='跳过数据抓取')
+    parser.add_argument('--email', help='LetPub 邮箱 (或环境变量 ZBIB_LETPUB_EMAIL)')
+    parser.add_argument('--password', help='LetPub 密码 (或环境变量 ZBIB_LETPUB_PASSWORD)')
+
+
+def _add_diagnose(parser):
+    parser.add_argument('project', nargs='?', help='项目目录')
+    parser.add_argument('--brief', action='store_true', help='简要输出')
+
+
+def _add_report(parser):
+    parser.add_argument('project', nargs='?', help='项目目录')
+    parser.add_argument('-o', '--output', help='输出文件名')
+
+
+def _add_kg(parser):
+    parser.add_argument('project', nargs='?', help='项目目录')
+
+
+# 子命令 -> (说明, 参数构建函数, 处理函数)
+SUBCOMMANDS = {
+    'new': ('创建新项目配置', None, cmd_new),
+    'run': ('运行分析流程', _add_run, cmd_run),
+    'diagnose': ('诊断项目状态', _add_diagnose, cmd_diagnose),
+    'report': ('生成综合报告', _add_report, cmd_report),
+    'kg': ('生成知识图谱', _add_kg, cmd_kg),
+    'version': ('显示版本信息', None, cmd_version),
+}
+
+_EPILOG = """
 示例:
   python zbib.py new                     创建新项目
   python zbib.py run config.yaml         运行分析
   python zbib.py diagnose projects/xxx   诊断项目
   python zbib.py report projects/xxx     生成报告
   python zbib.py kg projects/xxx         生成知识图谱
-        """
-    )
-
-    subparsers = parser.add_subparsers(dest='command', help='可用命令')
+"""
 
-    # new
-    p_new = subparsers.add_parser('new', help='创建新项目配置')
 
-    # run
-    p_run = subparsers.add_parser('run', help='运行分析流程')
-    p_run.add_argument('config', nargs='?', help='配置文件路径')
-    p_run.add_argument('--step', type=int, help='只运行指定步骤')
-    p_run.add_argument('--skip-fetch', action='store_true', help='跳过数据抓取')
-    p_run.add_argument('--email', help='LetPub 邮箱')
-    p_run.add_argument('--password', help='LetPub 密码')
+def _usage(prog: str) -> str:
+    return f"usage: {prog} [-h] {{{','.join(SUBCOMMANDS)}}} ...\n"
 
-    # diagnose
-    p_diag = subparsers.add_parser('diagnose', help='诊断项目状态')
-    p_diag.add_argument('project', nargs='?', help='项目目录')
-    p_diag.add_argument('--brief', action='store_true', help='简要输出')
 
-    # report
-    p_report = subparsers.add_parser('report', help='生成综合报告')
-    p_report.add_argument('project', nargs='?', help='项目目录')
-    p_report.add_argument('-o', '--output', help='输出文件名')
+def _help(prog: str) -> str:
+    """顶层帮助文本 (不经 argparse 生成)"""
+    commands = '\n'.join(f"    {name:<20}{text}" for name, (text, _, _) in SUBCOMMANDS.items())
+    return (f"{_usage(prog)}\n"
+            f"zbib — 文献情报学空白挖掘工具 v2.3\n\n"
+            f"可用命令:\n{commands}\n\n"
+            f"options:\n  -h, --help            show this help message and exit\n"
+            f"{_EPILOG}")
 
-    # kg
-    p_kg = subparsers.add_parser('kg', help='生成知识图谱')
-    p_kg.add_argument('project', nargs='?', help='项目目录')
 
-    # version
-    p_ver = subparsers.add_parser('version', help='显示版本信息')
+def main():
+    argv = sys.argv[1:]
+    prog = Path(sys.argv[0]).name
 
-    args = parser.parse_args()
+    # 快速路径: 打印版本无需构建 argparse
+    if argv in (['version'], ['--version'], ['-V']):
+        return cmd_version(None)
 
-    if args.command is None:
-        parser.print_help()
+    # 顶层只有 "命令 + 参数" 一层，手工分派；argparse 仅用于所选子命令的参数
+    if not argv or argv[0] in ('-h', '--help'):
+        sys.stdout.write(_help(prog))
         return 0
 
-    commands = {
-        'new': cmd_new,
-        'run': cmd_run,
-        'diagnose': cmd_diagnose,
-        'report': cmd_report,
-        'kg': cmd_kg,
-        'version': cmd_version,
-    }
+    command = argv[0]
+    if command not in SUBCOMMANDS:
+        choices = ', '.join(f"'{name}'" for name in SUBCOMMANDS)
+        sys.stderr.write(f"{_usage(prog)}{prog}: error: argument command: "
+                         f"invalid choice: '{command}' (choose from {choices})\n")
+        return 2
+
+    import argparse
 
-    return commands[args.command](args)
+    description, add_arguments, handler = SUBCOMMANDS[command]
+    parser = argparse.ArgumentParser(prog=f'{prog} {command}', description=description)
+    if add_arguments is not None:
+        add_arguments(parser)
+    return handler(parser.parse_args(argv[1:]))
 
 
 if __name__ == '__main__':